@@ -0,0 +1,25 @@
+"""Static collider count per shipped map, before and after tile merging.
+
+Run from the repository root:
+
+    python -m benchmarks.collider_report
+"""
+
+from pathlib import Path
+
+import pytmx
+
+from src import utils
+
+
+def main():
+    print(f"{'map':<12}{'tiles':>8}{'merged':>8}{'ratio':>8}")
+    for path in sorted(Path("assets").glob("map_*.tmx")):
+        grid = utils.make_tile_grid_from_tmx(pytmx.TiledMap(str(path)))
+        n_tiles = sum(grid.cells)
+        n_merged = len(grid.merged_rects())
+        print(f"{path.name:<12}{n_tiles:>8}{n_merged:>8}{n_tiles / n_merged:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
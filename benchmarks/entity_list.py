@@ -0,0 +1,59 @@
+"""Per-frame cost of updating and culling projectiles, comparing the old
+copy-and-remove updater with the in-place EntityList pass.
+
+Run from the repository root:
+
+    python -m benchmarks.entity_list
+"""
+
+import random
+import timeit
+
+from src import utils
+
+FRAMES = 20
+LIFETIME = 60
+
+
+class Projectile:
+    def __init__(self, rng: random.Random) -> None:
+        self.frames_left = rng.randrange(1, LIFETIME)
+        self.alive = True
+
+    def update(self):
+        self.frames_left -= 1
+        self.alive = self.frames_left > 0
+
+
+def copy_and_remove(entities):
+    for entity in entities[:]:
+        entity.update()
+
+        if not entity.alive:
+            entities.remove(entity)
+
+
+def run(update, n: int) -> float:
+    """Seconds per frame keeping `n` projectiles alive"""
+
+    rng = random.Random(n)
+    entities = utils.EntityList(Projectile(rng) for _ in range(n))
+
+    def frames():
+        for _ in range(FRAMES):
+            update(entities)
+            entities.extend(Projectile(rng) for _ in range(n - len(entities)))
+
+    return min(timeit.repeat(frames, number=1, repeat=3)) / FRAMES
+
+
+def main():
+    print(f"{'live':>8}{'copy+remove':>14}{'EntityList':>14}{'speedup':>10}")
+    for n in (1_000, 2_000, 5_000, 10_000):
+        old = run(copy_and_remove, n)
+        new = run(utils.updater, n)
+        print(f"{n:>8}{old * 1000:>12.2f}ms{new * 1000:>12.2f}ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
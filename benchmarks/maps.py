@@ -0,0 +1,212 @@
+"""Load time and per-step update and draw cost of every shipped map, under
+scripted input scenarios, written out as JSON.
+
+Run from the repository root:
+
+    python -m benchmarks.maps [--levels 1 2] [--scenarios idle run]
+                              [--steps 600] [--output results.json]
+"""
+
+import argparse
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pygame
+
+from src import shared, utils
+from src.core import Core
+from src.gabriel import Attack, Gabriel, RainOfSwordsData
+from src.game_state import GameState
+from src.guns import GunState
+from src.projectiles import Coin
+
+# Where the player sits on screen, as the camera follows them
+AIM_RIGHT = (450, 120)
+AIM_UP = (300, 0)
+
+
+def press(core: Core, key: int):
+    core.kp.add(key)
+    core.held.add(key)
+
+
+def release(core: Core, key: int):
+    core.kr.add(key)
+    core.held.discard(key)
+
+
+def equip(core: Core, step: int, key: int):
+    if step == 0:
+        press(core, key)
+    elif step == 1:
+        release(core, key)
+
+
+def idle(core: Core, step: int):
+    pass
+
+
+def run(core: Core, step: int):
+    """Runs right, turning back now and then, jumping every half second"""
+
+    direction = pygame.K_d if step % 400 < 300 else pygame.K_a
+    core.held.keys = {direction}
+    if step % 60 == 0:
+        press(core, pygame.K_SPACE)
+
+
+def shotgun_storm(core: Core, step: int):
+    """Fires the shotgun every step, ignoring its cooldown"""
+
+    equip(core, step, pygame.K_e)
+    shared.mouse_pos = pygame.Vector2(AIM_RIGHT)
+    shotgun = shared.player.guns.get("shotgun")
+    if shotgun is not None and shotgun.state == GunState.EQUIPPED:
+        shotgun.fire_shotgun()
+
+
+def coin_chain(core: Core, step: int):
+    """Keeps a few coins in the air and shoots into them for ricochets"""
+
+    equip(core, step, pygame.K_q)
+    shared.mouse_pos = pygame.Vector2(AIM_UP if step % 60 < 40 else AIM_RIGHT)
+    if step % 10 == 0 and step % 60 < 40:
+        shared.coins.append(
+            Coin.from_mouse(shared.player.collider.rect.center, 50, 3.0)
+        )
+    if step % 60 == 45:
+        core.mjp[0] = True
+
+
+def rain_of_swords(core: Core, step: int):
+    """Holds every Gabriel in the enraged rain of swords attack"""
+
+    for gabriel in Gabriel.objects:
+        gabriel.enraged = True
+        if gabriel.attack != Attack.RAIN_OF_SWORDS:
+            gabriel.attack = Attack.RAIN_OF_SWORDS
+            gabriel.rain_of_swords_data = RainOfSwordsData()
+            gabriel.pos.y = 250
+
+
+SCENARIOS = {
+    "idle": idle,
+    "run": run,
+    "shotgun_storm": shotgun_storm,
+    "coin_chain": coin_chain,
+    "rain_of_swords": rain_of_swords,
+}
+# Scenarios that only make sense on maps with what they drive
+REQUIRES = {"rain_of_swords": Gabriel}
+
+
+def summarize(seconds: list[float]) -> dict[str, float]:
+    ms = sorted(s * 1000 for s in seconds)
+    return {
+        "mean": statistics.fmean(ms),
+        "p50": ms[len(ms) // 2],
+        "p95": ms[min(len(ms) - 1, int(len(ms) * 0.95))],
+        "max": ms[-1],
+    }
+
+
+def bench(core: Core, level_no: int, scenario_name: str, steps: int) -> dict | None:
+    scenario = SCENARIOS[scenario_name]
+    shared.last_checkpoint = None
+    utils.rng.seed(level_no)
+
+    start = time.perf_counter()
+    core.start_level(level_no)
+    load_time = time.perf_counter() - start
+
+    required = REQUIRES.get(scenario_name)
+    if required is not None and not required.objects:
+        return None
+
+    update_times = []
+    draw_times = []
+    for step in range(steps):
+        core.get_events()
+        scenario(core, step)
+        shared.player.health = shared.player.MAX_HEALTH
+
+        start = time.perf_counter()
+        core.step()
+        update_times.append(time.perf_counter() - start)
+        if not isinstance(core.state_manager.state_obj, GameState):
+            break
+
+        start = time.perf_counter()
+        core.draw()
+        draw_times.append(time.perf_counter() - start)
+
+    return {
+        "level": level_no,
+        "scenario": scenario_name,
+        "load_ms": load_time * 1000,
+        "steps": len(update_times),
+        "update_ms": summarize(update_times),
+        "draw_ms": summarize(draw_times or [0.0]),
+    }
+
+
+def shipped_levels() -> list[int]:
+    return sorted(
+        int(re.search(r"\d+", path.stem).group())  # type: ignore
+        for path in Path("assets").glob("map_*.tmx")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, nargs="+", default=shipped_levels())
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--output", help="file to write, stdout if not given")
+    args = parser.parse_args()
+
+    # Picking up a gun saves to disk; keep the real save untouched
+    save_path = Path("save-data/data.json")
+    save = save_path.read_bytes()
+
+    core = Core(headless=True)
+    shared.save_data["weapons"] = ["pistol", "shotgun", "sawblade"]
+    shared.frame_alpha = 1.0
+    results = []
+    try:
+        for level_no in args.levels:
+            for scenario_name in args.scenarios:
+                result = bench(core, level_no, scenario_name, args.steps)
+                if result is None:
+                    continue
+                results.append(result)
+                print(
+                    f"map_{level_no} {scenario_name:<15}"
+                    f" load {result['load_ms']:7.1f} ms"
+                    f"  update {result['update_ms']['mean']:6.2f} ms"
+                    f"  draw {result['draw_ms']['mean']:6.2f} ms",
+                    file=sys.stderr,
+                )
+    finally:
+        save_path.write_bytes(save)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "steps": args.steps,
+        "results": results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Frame cost against entity count on generated maps, broken down by
+profiler section, to find where each subsystem stops scaling.
+
+Every run builds a walled map with platforms, fills it with enemies, then
+keeps a set number of bullets, magnets and sawblades alive while it steps
+and draws through the normal World path.
+
+Run from the repository root:
+
+    python -m benchmarks.stress [--enemies 0 50 100 200 400]
+                                [--projectiles 200] [--launched 20]
+                                [--size 200 60] [--output results.json]
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from src import enemies, shared, utils
+from src.core import Core
+from src.game_state import GameState
+from src.profiler import profiler
+from src.projectiles import Bullet, Magnet, Sawblade
+from src.spawner import EntitySpawner
+
+TILESET = Path("assets/tiles.tsx").resolve()
+ENEMY_TYPES = ["Filth", "Soldier", "Virtue", "Maurice"]
+PLATFORM_GAP = 8
+TMX = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down" \
+width="{width}" height="{height}" tilewidth="16" tileheight="16" infinite="0" \
+nextlayerid="4" nextobjectid="3">
+ <tileset firstgid="1" source="{tileset}"/>
+ <layer id="1" name="Tile Layer 1" width="{width}" height="{height}">
+  <data encoding="csv">
+{csv}
+</data>
+ </layer>
+ <objectgroup id="2" name="Spawners">
+  <object id="1" x="0" y="0" width="{pixel_width}" height="{pixel_height}"/>
+ </objectgroup>
+ <objectgroup id="3" name="FilthyAreas">
+  <object id="2" x="0" y="0" width="{pixel_width}" height="{pixel_height}"/>
+ </objectgroup>
+</map>
+"""
+
+
+def tile_gids() -> dict[str, int]:
+    """First global tile id of each tile type in the shared tileset"""
+
+    gids = {}
+    for tile in ET.parse(TILESET).getroot().iter("tile"):
+        gids.setdefault(tile.get("type"), int(tile.get("id")) + 1)  # type: ignore
+    return gids
+
+
+def write_stress_map(
+    path: Path, width: int, height: int, n_enemies: int, seed: int = 0
+):
+    """Walled map with a platform every `PLATFORM_GAP` rows, the player in
+    the bottom left and `n_enemies` spread over the free cells, all inside
+    one spawner and filthy area"""
+
+    rng = random.Random(seed)
+    gids = tile_gids()
+    cells = [[0] * width for _ in range(height)]
+
+    for col in range(width):
+        cells[0][col] = cells[height - 1][col] = gids["Tile"]
+    for row in range(height):
+        cells[row][0] = cells[row][width - 1] = gids["Tile"]
+    for row in range(height - 1 - PLATFORM_GAP, 0, -PLATFORM_GAP):
+        for col in range(1, width - 1):
+            if col % 16 >= 4:
+                cells[row][col] = gids["Tile"]
+
+    cells[height - 3][2] = gids["Player"]
+    free = [
+        (col, row)
+        for row in range(1, height - 2)
+        for col in range(4, width - 1)
+        if not cells[row][col] and not cells[row + 1][col]
+    ]
+    for i, (col, row) in enumerate(rng.sample(free, min(n_enemies, len(free)))):
+        cells[row][col] = gids[ENEMY_TYPES[i % len(ENEMY_TYPES)]]
+
+    path.write_text(
+        TMX.format(
+            width=width,
+            height=height,
+            pixel_width=width * shared.TILE_SIDE,
+            pixel_height=height * shared.TILE_SIDE,
+            tileset=TILESET,
+            csv=",\n".join(",".join(map(str, row)) for row in cells),
+        )
+    )
+
+
+def random_launch(rng: random.Random) -> tuple[tuple[float, float], float]:
+    """Position in the map's inner area and a direction to fly in"""
+
+    width = shared.tmx_map.width * shared.TILE_SIDE
+    height = shared.tmx_map.height * shared.TILE_SIDE
+    pos = (rng.uniform(32, width - 32), rng.uniform(32, height - 32))
+    return pos, rng.uniform(-math.pi, math.pi)
+
+
+def top_up(rng: random.Random, n_projectiles: int, n_launched: int):
+    """Replaces projectiles that died last step. They deal no damage, so the
+    enemy count stays put"""
+
+    while len(shared.pistol_bullets) < n_projectiles:
+        pos, radians = random_launch(rng)
+        shared.pistol_bullets.append(Bullet.pool.acquire(pos, radians, 200, 1.0, 0))
+    while len(shared.magnets) < n_launched // 2:
+        pos, radians = random_launch(rng)
+        shared.magnets.append(Magnet(pos, radians, 100, 5.0))
+    while len(shared.sawblades) < n_launched - n_launched // 2:
+        pos, radians = random_launch(rng)
+        shared.sawblades.append(Sawblade.pool.acquire(pos, radians, 150, 5.0, 0))
+
+
+def run(
+    core: Core, map_path: Path, steps: int, n_projectiles: int, n_launched: int
+) -> dict:
+    rng = random.Random(0)
+    shared.last_checkpoint = None
+    utils.rng.seed(0)
+
+    start = time.perf_counter()
+    core.start_level(0, str(map_path))
+    load_time = time.perf_counter() - start
+    for spawner in EntitySpawner.objects:
+        spawner.activate()
+
+    profiler.toggle()
+    frame_times = []
+    for _ in range(steps):
+        core.get_events()
+        top_up(rng, n_projectiles, n_launched)
+        shared.player.health = shared.player.MAX_HEALTH
+
+        start = time.perf_counter()
+        core.step()
+        if not isinstance(core.state_manager.state_obj, GameState):
+            break
+        core.draw()
+        frame_times.append(time.perf_counter() - start)
+    sections = {name: profiler.mean_ms(name) for name in profiler.history}
+    profiler.toggle()
+
+    return {
+        "load_ms": load_time * 1000,
+        "steps": len(frame_times),
+        "frame_ms": statistics.fmean(frame_times) * 1000,
+        "sections_ms": dict(sorted(sections.items(), key=lambda s: -s[1])),
+        "awake_enemies": len(enemies.registry.active),
+    }
+
+
+def chart(results: list[dict], width: int = 50):
+    """Frame time bars per enemy count, to eyeball the scaling curve"""
+
+    slowest = max(result["frame_ms"] for result in results) or 1.0
+    for result in results:
+        bar = "#" * round(result["frame_ms"] / slowest * width)
+        top = next(iter(result["sections_ms"]), "")
+        print(
+            f"{result['enemies']:>6} enemies {result['frame_ms']:7.2f} ms"
+            f" {bar:<{width}} {top}",
+            file=sys.stderr,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--enemies", type=int, nargs="+", default=[0, 50, 100, 200, 400]
+    )
+    parser.add_argument("--projectiles", type=int, default=200)
+    parser.add_argument(
+        "--launched", type=int, default=20, help="magnets and sawblades"
+    )
+    parser.add_argument("--size", type=int, nargs=2, default=[200, 60])
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--output", help="file to write, stdout if not given")
+    args = parser.parse_args()
+
+    core = Core(headless=True)
+    shared.frame_alpha = 1.0
+    width, height = args.size
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_enemies in args.enemies:
+            map_path = Path(tmp) / f"stress_{n_enemies}.tmx"
+            write_stress_map(map_path, width, height, n_enemies)
+            result = run(core, map_path, args.steps, args.projectiles, args.launched)
+            result["enemies"] = n_enemies
+            results.append(result)
+
+    report = {
+        "size": args.size,
+        "projectiles": args.projectiles,
+        "launched": args.launched,
+        "steps": args.steps,
+        "results": results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    chart(results)
+
+
+if __name__ == "__main__":
+    main()
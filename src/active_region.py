@@ -0,0 +1,36 @@
+import pygame
+
+from src import shared, utils
+
+
+class ActiveRegion:
+    """Only entities within `margin` of the camera get updated. Far ones
+    freeze, with `near` cleared so systems skip them too, and are told how
+    long they slept when they wake"""
+
+    def __init__(self, margin: int = shared.ACTIVE_REGION_MARGIN) -> None:
+        self.margin = margin
+        self.rect = pygame.Rect()
+        self.frozen_at: dict[object, float] = {}
+
+    def update(self):
+        self.rect = shared.camera.rect.inflate(self.margin * 2, self.margin * 2)
+
+    def tick(self, obj):
+        obj.near = self.rect.colliderect(obj.rect)
+        if obj.near:
+            frozen_at = self.frozen_at.pop(obj, None)
+            if frozen_at is not None:
+                obj.resume(utils.now() - frozen_at)
+            obj.update()
+            return
+
+        self.frozen_at.setdefault(obj, utils.now())
+
+    def forget(self, obj):
+        """Drops a dead entity, which may have died while frozen"""
+
+        self.frozen_at.pop(obj, None)
+
+    def clear(self):
+        self.frozen_at.clear()
@@ -1,6 +1,6 @@
 import pygame
 
-from src import shared
+from src import shared, utils
 
 
 class Line:
@@ -37,7 +37,7 @@ class Line:
 
 class Background:
     def __init__(self, bg_color, line_color) -> None:
-        self.lines: list[Line] = [Line()]
+        self.lines = utils.EntityList([Line()])
         self.header = self.lines[0]
         self.bg_color = bg_color
         self.line_color = line_color
@@ -47,10 +47,7 @@ class Background:
             self.lines.append(Line())
             self.header = self.lines[-1]
 
-        for line in self.lines[:]:
-            line.update()
-            if not line.alive:
-                self.lines.remove(line)
+        self.lines.update()
 
     def draw(self):
         shared.screen.fill(self.bg_color)
@@ -1,5 +1,3 @@
-import time
-
 import pygame
 
 from src import shared, utils
@@ -9,13 +7,19 @@ class BloodSplatter:
     RADIUS = 16 * 2
     DURATION = 0.7
 
+    pool = utils.Pool()
+
     def __init__(self, center, heal) -> None:
-        self.center = pygame.Vector2(center)
         self.image = utils.circle_surf(BloodSplatter.RADIUS, "red")
+        self.rect = self.image.get_rect()
+        self.reset(center, heal)
+
+    def reset(self, center, heal):
+        self.center = pygame.Vector2(center)
         self.image.set_alpha(70)
-        self.rect = self.image.get_rect(center=self.center)
+        self.rect.center = self.center
 
-        self.start = time.perf_counter()
+        self.start = utils.now()
         self.alive = True
         self.received_health = False
         self.heal = heal
@@ -28,7 +32,7 @@ class BloodSplatter:
             shared.player.health = min(shared.player.health, shared.player.MAX_HEALTH)
             self.received_health = True
 
-        diff = time.perf_counter() - self.start
+        diff = utils.now() - self.start
         amount = diff / BloodSplatter.DURATION
 
         if amount >= 1:
@@ -1,4 +1,3 @@
-import time
 import typing as t
 
 import pygame
@@ -16,8 +15,10 @@ class Checkpoint:
         self.rect = self.image.get_rect(topleft=self.pos)
         self.font = utils.load_font("assets/ultrakill.ttf", 12)
         self.surf = self.font.render("Checkpoint!", False, shared.PALETTE["yellow"])
+        # Faded on its own, since scaled variants of `surf` are shared
+        self.fade_surf = self.surf.copy()
         self.scale = 0.1
-        self.start = time.perf_counter()
+        self.start = utils.now()
         self.performing_effect = False
 
     def update(self):
@@ -26,14 +27,18 @@ class Checkpoint:
             and shared.last_checkpoint is not self
         ):
             shared.last_checkpoint = self
-            self.start = time.perf_counter()
+            self.start = utils.now()
             self.performing_effect = True
 
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        return self.rect.union(self.surf.get_rect(midbottom=self.rect.midtop))
+
     def perform_effect(self):
         max_y_offset = -10
         expand_time = 0.1
 
-        diff = time.perf_counter() - self.start
+        diff = utils.now() - self.start
         if diff > 1.5:
             self.performing_effect = False
         elif diff > expand_time:
@@ -41,7 +46,7 @@ class Checkpoint:
             fade_ratio = min(1.0, fade_ratio)
             fade_ratio = 1 - fade_ratio
 
-            surf = self.surf.copy()
+            surf = self.fade_surf
             surf.set_alpha(int(255 * fade_ratio))
             rect = surf.get_rect(
                 midbottom=self.rect.midtop + pygame.Vector2(0, max_y_offset)
@@ -51,7 +56,7 @@ class Checkpoint:
         else:
             self.scale = diff / expand_time
             self.scale = min(1.0, self.scale)
-            text_surf = pygame.transform.scale_by(self.surf, self.scale)
+            text_surf = utils.scales.scale_by(self.surf, self.scale)
             rect = text_surf.get_rect(midbottom=self.rect.midtop)
 
             y_offset = max_y_offset * self.scale
@@ -1,42 +1,105 @@
+import argparse
+import contextlib
+import itertools
 import json
-import sys
+import os
+import random
 
 import pygame
 
-from src import shared
+from src import shared, utils
+from src.enums import State
+from src.profiler import profiler
+from src.replay import InputPlayer, InputRecorder
 from src.states import StateManager
 
 
 class Core:
-    def __init__(self) -> None:
+    STEP = 1 / shared.SIM_RATE
+
+    def __init__(self, headless: bool = False, debug: bool = False) -> None:
+        self.headless = headless
+        self.debug = debug
         self.win_init()
+        # One step's worth so the first frame updates before drawing
+        self.accumulator = Core.STEP
+        self.held = utils.KeySet()
+        self.latch_input()
+        self.recorder: InputRecorder | None = None
+        self.replay: InputPlayer | None = None
         with open("save-data/data.json") as f:
             shared.save_data = json.load(f)
         shared.last_checkpoint = None
         self.state_manager = StateManager()
 
     def win_init(self):
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
 
-        if len(sys.argv) > 1 and sys.argv[1] == "-d":
+        if self.debug or self.headless:
             flags = 0
         else:
             flags = pygame.FULLSCREEN | pygame.SCALED
 
-        shared.screen = pygame.display.set_mode((600, 300), flags, vsync=1)
+        shared.screen = pygame.display.set_mode(
+            (600, 300), flags, vsync=not self.headless
+        )
         shared.srect = shared.screen.get_rect()
         shared.clock = pygame.Clock()
+        self.sound_init()
+
+    def sound_init(self):
+        pygame.mixer.init()
+        shared.sounds = {
+            name: pygame.Sound(f"assets/sounds/{name}.wav")
+            for name in shared.SOUND_NAMES
+        }
+
+    def start_level(self, level_no: int, map_path: str | None = None):
+        world = getattr(self.state_manager.state_obj, "world", None)
+        if world is not None:
+            world.clear_world()
+
+        shared.level_no = level_no
+        shared.map_path = map_path
+        shared.next_state = State.GAME
+        self.state_manager.set_state()
+
+    def latch_input(self):
+        """Starts collecting one-off input for the next simulation step"""
+
+        self.events = []
+        self.kp = utils.KeySet()
+        self.kr = utils.KeySet()
+        self.mjp = [False] * 5
+        self.mjr = [False] * 5
 
     def get_events(self):
-        shared.events = pygame.event.get()
-        shared.dt = shared.clock.tick() / 1000
-        shared.dt = max(shared.dt, 0.1)
-        shared.keys = pygame.key.get_pressed()
-        shared.kp = pygame.key.get_just_pressed()
-        shared.kr = pygame.key.get_just_released()
+        """Polls input once per frame. Held state is read straight away,
+        while events and presses are kept until a step consumes them"""
+
+        events = pygame.event.get()
+        self.events.extend(events)
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self.kp.add(event.key)
+                self.held.add(event.key)
+                if event.key == profiler.TOGGLE_KEY:
+                    profiler.toggle()
+            elif event.type == pygame.KEYUP:
+                self.kr.add(event.key)
+                self.held.discard(event.key)
+
+        for button, (pressed, released) in enumerate(
+            zip(pygame.mouse.get_just_pressed(), pygame.mouse.get_just_released())
+        ):
+            self.mjp[button] |= pressed
+            self.mjr[button] |= released
+
+        shared.keys = self.held
         shared.mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
-        shared.mjr = pygame.mouse.get_just_released()
-        shared.mjp = pygame.mouse.get_just_pressed()
         shared.mouse_press = pygame.mouse.get_pressed()
 
     def write_save_data(self):
@@ -51,22 +114,107 @@ class Core:
                 if event.key == pygame.K_ESCAPE:
                     raise SystemExit
 
-    def update(self):
-        self.get_events()
+    def step(self):
+        """Advances the game by one fixed simulation step"""
+
+        shared.dt = Core.STEP * shared.TIME_SCALE
+        shared.events = self.events
+        shared.kp, shared.kr = self.kp, self.kr
+        shared.mjp, shared.mjr = tuple(self.mjp), tuple(self.mjr)
+        self.latch_input()
+        if self.replay is not None and not self.replay.play():
+            raise SystemExit
+        if self.recorder is not None:
+            self.recorder.record()
+        utils.sim_clock.advance(Core.STEP)
+
         self.check_for_exit()
         self.state_manager.update()
 
+    def update(self):
+        with profiler.section("input"):
+            self.get_events()
+
+        # Frames slower than the step cap drop time rather than spiralling
+        frame_time = shared.clock.tick() / 1000
+        max_time = Core.STEP * shared.MAX_STEPS_PER_FRAME
+        self.accumulator = min(self.accumulator + frame_time, max_time)
+        while self.accumulator >= Core.STEP:
+            self.step()
+            self.accumulator -= Core.STEP
+
+        shared.frame_alpha = self.accumulator / Core.STEP
+
     def draw(self):
         shared.screen.fill("black")
         self.state_manager.draw()
-        pygame.display.flip()
+        profiler.draw()
+        with profiler.section("flip"):
+            pygame.display.flip()
+        profiler.end_frame()
 
     def run(self):
         while True:
             self.update()
             self.draw()
 
+    def run_headless(self, steps: int | None = None, render: bool = False):
+        """Steps the simulation back to back, ignoring the wall clock. Only
+        draws, offscreen, if `render` is set"""
+
+        shared.frame_alpha = 1.0
+        for _ in itertools.count() if steps is None else range(steps):
+            self.get_events()
+            self.step()
+            if render:
+                self.draw()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-d", "--debug", action="store_true", help="windowed, with pool stats on exit"
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="no display or sound device, simulating as fast as possible",
+    )
+    parser.add_argument(
+        "--render", action="store_true", help="still draw offscreen when headless"
+    )
+    parser.add_argument("--level", type=int, help="start straight in this level")
+    parser.add_argument("--record", help="save this session's input to a file")
+    parser.add_argument("--replay", help="play back input saved with --record")
+    parser.add_argument(
+        "--steps", type=int, help="stop after this many steps when headless"
+    )
+    return parser.parse_args()
+
 
 def main():
-    core = Core()
-    core.run()
+    args = parse_args()
+    core = Core(headless=args.headless, debug=args.debug)
+    level_no = args.level
+    if args.replay is not None:
+        core.replay = InputPlayer(args.replay)
+        shared.save_data = core.replay.save_data
+        utils.rng.seed(core.replay.seed)
+        level_no = core.replay.level_no
+    elif args.record is not None:
+        seed = random.randrange(2**32)
+        utils.rng.seed(seed)
+        core.recorder = InputRecorder(args.record, seed, level_no)
+
+    with core.recorder or contextlib.nullcontext():
+        if level_no is not None:
+            core.start_level(level_no)
+
+        try:
+            if args.headless:
+                core.run_headless(args.steps, render=args.render)
+            else:
+                core.run()
+        finally:
+            if args.debug:
+                print("\n".join(utils.Pool.report()))
@@ -0,0 +1,49 @@
+import itertools
+
+from src import enemies, shared
+from src.ui import CoinLineEffect, Flash
+
+
+class DamageSystem:
+    """Resolves every projectile-versus-enemy hit once per frame"""
+
+    def targets_hit(self, projectile) -> list:
+        return [
+            enemy
+            for enemy in enemies.registry.nearby(projectile.path_rect)
+            if enemy.spawned and projectile.hits(enemy.rect)
+        ]
+
+    def on_bullet_hit(self, enemy, bullet):
+        enemy.health -= bullet.damage
+        bullet.alive = False
+
+        if bullet.coin_history:
+            points = [shared.player.collider.pos] + bullet.coin_history + [enemy.pos]
+            shared.fx_manager.coin_lines.append(CoinLineEffect(points))
+            shared.fx_manager.flashes.append(Flash())
+
+    def apply_hits(self):
+        for bullet in itertools.chain(shared.shotgun_bullets, shared.pistol_bullets):
+            for enemy in self.targets_hit(bullet):
+                self.on_bullet_hit(enemy, bullet)
+
+        for blade in shared.sawblades:
+            for enemy in self.targets_hit(blade):
+                enemy.health -= blade.damage * shared.dt / shared.FRAME_DT
+
+        for fireball in shared.fireballs:
+            if not fireball.boosted:
+                continue
+
+            for enemy in self.targets_hit(fireball):
+                enemy.health -= fireball.DAMAGE
+                fireball.alive = False
+
+    def update(self):
+        if enemies.registry.active:
+            self.apply_hits()
+
+        for enemy in enemies.registry.active[:]:
+            if enemy.spawned:
+                enemy.check_health()
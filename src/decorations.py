@@ -27,6 +27,7 @@ class FGDecoration:
         self.pos = pygame.Vector2(pos)
         FGDecoration.objects.append(self)
         self.image = image
+        self.rect = self.image.get_rect(topleft=self.pos)
 
     def update(self):
         pass
@@ -52,6 +53,10 @@ class Note:
             midbottom=self.rect.midtop + pygame.Vector2(0, -10)
         )
 
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        return self.rect.union(self.text_rect)
+
     def update(self):
         pass
 
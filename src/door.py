@@ -26,7 +26,7 @@ class HellPit:
 
     def update(self):
         if shared.player.frozen:
-            shared.player.collider.pos.y += HellPit.FALL_SPEED * shared.dt
+            shared.player.collider.y += HellPit.FALL_SPEED * shared.dt
 
             if (
                 shared.player.collider.pos.y
@@ -0,0 +1,146 @@
+import math
+
+import pygame
+
+from src import shared, utils
+
+ACTIVATED = 1
+SPAWNED = 2
+# Inside the active region as of its last tick
+NEAR = 4
+
+store = utils.ComponentStore(
+    x="d",
+    y="d",
+    prev_x="d",
+    prev_y="d",
+    speed="d",
+    health="d",
+    spawn_start="d",
+    flags="B",
+)
+
+
+def begin_step():
+    """Keeps this step's starting positions to draw enemies between steps"""
+
+    store["prev_x"][:] = store["x"]
+    store["prev_y"][:] = store["y"]
+
+
+def activate(row: int):
+    store["flags"][row] |= ACTIVATED
+    store["spawn_start"][row] = utils.now()
+
+
+class SpawnSystem:
+    """Flickers activated enemies through their spawn animation, then marks
+    them spawned"""
+
+    ANIMATION_TIME = 0.7
+    FLICKER_TIME = 0.2
+
+    def update(self):
+        flags = store["flags"]
+        spawn_starts = store["spawn_start"]
+        now = utils.now()
+
+        for row, owner in enumerate(store.owners):
+            if flags[row] & (ACTIVATED | SPAWNED) != ACTIVATED:
+                continue
+
+            elapsed = now - spawn_starts[row]
+            if elapsed >= SpawnSystem.ANIMATION_TIME:
+                owner.image = owner.original_image
+                flags[row] |= SPAWNED
+            elif int(elapsed / SpawnSystem.FLICKER_TIME) % 2:
+                owner.image = owner.original_image
+            else:
+                owner.image = owner.white_image
+
+
+class ChaseSystem:
+    """Moves spawned enemies near the camera with a chase speed straight at
+    the player"""
+
+    def update(self):
+        xs, ys = store["x"], store["y"]
+        speeds = store["speed"]
+        flags = store["flags"]
+        target_x, target_y = shared.player.collider.pos
+
+        for row in range(len(flags)):
+            if flags[row] & (SPAWNED | NEAR) != SPAWNED | NEAR or not speeds[row]:
+                continue
+
+            dx = target_x - xs[row]
+            dy = target_y - ys[row]
+            dist = math.hypot(dx, dy)
+            step = speeds[row] * shared.dt
+            if dist <= step:
+                xs[row], ys[row] = target_x, target_y
+            else:
+                xs[row] += dx / dist * step
+                ys[row] += dy / dist * step
+
+
+class EnemyRegistry:
+    """Every awake enemy, added on activation and removed on death, with a
+    spatial index rebuilt once per frame for area queries"""
+
+    CELL_SIZE = shared.TILE_SIDE * 4
+
+    def __init__(self) -> None:
+        self.active: list = []
+        self.grid = utils.SpatialHash(EnemyRegistry.CELL_SIZE)
+        # Rects as of indexing, since enemies move between reindexes. Keyed by
+        # every active enemy, so it doubles as the set to check membership in
+        self.indexed_rects: dict = {}
+
+    def __contains__(self, enemy) -> bool:
+        return enemy in self.indexed_rects
+
+    def index(self, enemy):
+        rect = self.indexed_rects[enemy] = enemy.rect.copy()
+        self.grid.insert(enemy, rect)
+
+    def add(self, enemy):
+        self.active.append(enemy)
+        self.index(enemy)
+
+    def remove(self, enemy):
+        if enemy in self:
+            self.active.remove(enemy)
+            self.grid.remove(enemy, self.indexed_rects.pop(enemy))
+
+    def clear(self):
+        self.active.clear()
+        self.grid.clear()
+        self.indexed_rects.clear()
+
+    def reindex(self):
+        self.grid.clear()
+        self.indexed_rects.clear()
+        for enemy in self.active:
+            self.index(enemy)
+
+    def nearby(self, rect: pygame.Rect | pygame.FRect) -> list:
+        """Enemies that may overlap `rect`, for callers with their own test"""
+
+        return self.grid.query(rect)
+
+    def in_rect(self, rect: pygame.Rect | pygame.FRect) -> list:
+        return [enemy for enemy in self.nearby(rect) if rect.colliderect(enemy.rect)]
+
+    def in_radius(self, center, radius: float) -> list:
+        center = pygame.Vector2(center)
+        area = pygame.FRect(0, 0, radius * 2, radius * 2)
+        area.center = center
+        return [
+            enemy
+            for enemy in self.nearby(area)
+            if center.distance_to(enemy.rect.center) <= radius
+        ]
+
+
+registry = EnemyRegistry()
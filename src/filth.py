@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-import itertools
-import time
 import typing as t
 
 import pygame
 
-from src import shared, utils
+from src import enemies, shared, utils
 from src.blood_splatter import BloodSplatter
-from src.ui import CoinLineEffect, Flash
 
 if t.TYPE_CHECKING:
     from src.spawner import EntitySpawner
@@ -18,7 +15,6 @@ class FilthyArea:
     def __init__(self, pos, width, height) -> None:
         self.pos = pygame.Vector2(pos)
         self.rect = pygame.Rect(self.pos, (width, height))
-        self.tiles = []
 
 
 class Filth:
@@ -26,6 +22,12 @@ class Filth:
     spawner: EntitySpawner
     filthy_area: FilthyArea
 
+    pos = enemies.store.vector("x", "y")
+    prev_pos = enemies.store.vector("prev_x", "prev_y")
+    health = enemies.store.column("health")
+    spawned = enemies.store.flag("flags", enemies.SPAWNED)
+    near = enemies.store.flag("flags", enemies.NEAR)
+
     SPEED = 30.0
     PLAYER_PROXIMITY_DIST = 100
     JUMP_VELOCITY = -70
@@ -34,7 +36,9 @@ class Filth:
 
     def __init__(self, pos, image: pygame.Surface) -> None:
         Filth.objects.append(self)
+        self.row = enemies.store.add(self)
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos
         self.original_image = image
         self.image = image
         self.health = 100
@@ -42,14 +46,9 @@ class Filth:
         self.gravity = utils.Gravity()
         self.touched_ground = True
 
-        self.spawn_start_time: float | None = None
-        self.spawn_animation_timer = utils.Timer(0.2)
-
         self.white_image = image.copy()
         self.white_image.fill("purple", special_flags=pygame.BLEND_RGBA_ADD)
 
-        self.spawn_images = itertools.cycle([self.white_image, image])
-
         self.dx, self.dy = 0, 0
         self.damage_cooldown = utils.CooldownTimer(0.5)
 
@@ -60,16 +59,16 @@ class Filth:
         self.dx += Filth.SPEED * dir * shared.dt
 
     def check_tile_collisions(self):
-        for tile in self.filthy_area.tiles:
-            if tile.rect.colliderect(self.rect.move(0, self.dy)):
-                self.gravity.velocity = 0
-                self.dy = 0
+        area_rect = self.filthy_area.rect
+        if shared.tile_grid.any_solid(self.rect.move(0, self.dy), area_rect):
+            self.gravity.velocity = 0
+            self.dy = 0
 
-                if self.dy > 0:
-                    self.touched_ground = True
+            if self.dy > 0:
+                self.touched_ground = True
 
-            if tile.rect.colliderect(self.rect.move(self.dx, 0)):
-                self.dx = 0
+        if shared.tile_grid.any_solid(self.rect.move(self.dx, 0), area_rect):
+            self.dx = 0
 
         if not self.filthy_area.rect.colliderect(self.rect.move(self.dx, 0)):
             self.dx = 0
@@ -106,26 +105,13 @@ class Filth:
         ):
             self.health -= shared.player.PUNCH_DAMAGE
 
-    def is_out_of_view(self):
-        return not shared.camera.rect.colliderect(self.rect)
+    def resume(self, slept: float):
+        self.damage_cooldown.shift(slept)
 
     def update(self):
-        if not self.spawner.activated:
-            return
-        elif self.spawn_start_time is None:
-            self.spawn_start_time = time.perf_counter()
-
-        if time.perf_counter() - self.spawn_start_time < 0.7:
-            if self.spawn_animation_timer.tick():
-                self.image = next(self.spawn_images)
+        if not self.spawned:
             return
-        else:
-            self.image = self.original_image
-
-        self.handle_damage()
 
-        if self.is_out_of_view():
-            return
         self.dx, self.dy = 0, 0
         self.gravity.update()
         self.jump()
@@ -135,40 +121,19 @@ class Filth:
         self.handle_punch()
         self.rect.topleft = self.pos
 
-    def on_bullet_collide(self, bullet):
-        self.health -= bullet.damage
-        bullet.alive = False
-
-        if bullet.coin_history:
-            points = [shared.player.collider.pos] + bullet.coin_history + [self.pos]
-            shared.fx_manager.coin_lines.append(CoinLineEffect(points))
-            shared.fx_manager.flashes.append(Flash())
-
-    def handle_damage(self):
-        for bullet in shared.shotgun_bullets + shared.pistol_bullets:
-            if self.rect.colliderect(bullet.collider_rect):
-                self.on_bullet_collide(bullet)
-
-        for blade in shared.sawblades:
-            if blade.rect.colliderect(self.rect):
-                self.health -= blade.damage
-
-        for fireball in shared.fireballs:
-            if not fireball.boosted:
-                continue
-
-            if fireball.rect.colliderect(self.rect):
-                self.health -= fireball.DAMAGE
-                fireball.alive = False
+    def check_health(self):
         if self.health <= 0:
             try:
                 Filth.objects.remove(self)
-                shared.blood_splatters.append(BloodSplatter(self.rect.center, 100))
+                enemies.store.release(self.row)
+                enemies.registry.remove(self)
+                shared.active_region.forget(self)
+                shared.blood_splatters.append(
+                    BloodSplatter.pool.acquire(self.rect.center, 100)
+                )
             except ValueError:
                 pass
 
     def draw(self):
-        if not self.spawner.activated:
-            return
-
-        shared.screen.blit(self.image, shared.camera.transform(self.pos))
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            shared.screen.blit(self.image, shared.camera.transform(self.pos))
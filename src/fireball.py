@@ -6,16 +6,44 @@ from src import shared, utils
 class FireBall:
     DAMAGE = 100
 
+    pool = utils.Pool()
+
     def __init__(self, pos, radians, speed) -> None:
         self.image = utils.load_image("assets/fireball.png", True, bound=True)
         self.rect = self.image.get_rect()
+        self.last_rect = self.rect.copy()
+        self.reset(pos, radians, speed)
+
+    def reset(self, pos, radians, speed):
         self.speed = speed
         self.radians = radians
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
+        self.rect.topleft = self.pos
+        self.last_rect.topleft = self.rect.topleft
         self.alive = True
         self.boosted = False
 
+    def hits(self, rect: pygame.Rect) -> bool:
+        return utils.swept_collide(self.last_rect, self.rect, rect)
+
+    @property
+    def path_rect(self) -> pygame.Rect:
+        return self.last_rect.union(self.rect)
+
+    def check_terrain(self):
+        dx = self.rect.x - self.last_rect.x
+        dy = self.rect.y - self.last_rect.y
+        toi = shared.tile_grid.sweep(self.last_rect, dx, dy)
+        if toi is None:
+            return
+
+        self.pos.update(self.last_rect.x + dx * toi, self.last_rect.y + dy * toi)
+        self.rect.topleft = self.pos
+        self.speed = 0
+
     def update(self):
+        self.last_rect.topleft = self.rect.topleft
         self.pos = utils.move_towards_rad(
             self.pos, self.radians, self.speed * shared.dt
         )
@@ -29,10 +57,16 @@ class FireBall:
         ):
             self.alive = False
 
-        if self.rect.colliderect(shared.player.collider.rect):
+        if self.speed <= 0:
+            self.alive = False
+        else:
+            self.check_terrain()
+
+        if self.hits(shared.player.collider.rect):
             self.alive = False
             shared.player.health -= FireBall.DAMAGE
 
     def draw(self):
-        shared.screen.blit(self.image, shared.camera.transform(self.pos))
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            shared.screen.blit(self.image, shared.camera.transform(self.pos))
         # utils.debug_rect(self.rect)
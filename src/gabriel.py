@@ -1,17 +1,13 @@
-import random
-import time
 import typing as t
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
 import pygame
 
-from src import shared, utils
+from src import enemies, shared, utils
 from src.blood_splatter import BloodSplatter
 from src.enums import State
 from src.fireball import FireBall
-from src.tiles import Tile
-from src.ui import CoinLineEffect, Flash
 
 
 class Attack(Enum):
@@ -30,18 +26,20 @@ class Spawner:
 class RainSword:
     gabriel_center: pygame.Vector2
     pos: pygame.Vector2 = field(init=False)
+    prev_pos: pygame.Vector2 = field(init=False)
     rect: pygame.Rect = field(init=False)
     vel_y: float = 0.0
     alive: bool = True
 
     def __post_init__(self):
         self.pos = pygame.Vector2(
-            random.randrange(
+            utils.rng.randrange(
                 int(self.gabriel_center.x - shared.srect.width / 2),
                 int(self.gabriel_center.x + shared.srect.width / 2),
             ),
             self.gabriel_center.y,
         )
+        self.prev_pos = self.pos.copy()
         image = utils.load_image("assets/sword.png", True, bound=True)
         self.rect = image.get_rect(center=self.pos)
 
@@ -63,8 +61,8 @@ class RainSword:
 
 @dataclass
 class RainOfSwordsData:
-    swords: list[RainSword] = field(default_factory=list)
-    spawn_cooldown: utils.Timer = utils.Timer(0.01)
+    swords: utils.EntityList = field(default_factory=utils.EntityList)
+    spawn_cooldown: utils.Timer = field(default_factory=lambda: utils.Timer(0.01))
     image: pygame.Surface = field(init=False)
 
     def __post_init__(self):
@@ -81,12 +79,14 @@ class DualTossData:
 
     sword_1_pos: pygame.Vector2 = field(init=False)
     sword_2_pos: pygame.Vector2 = field(init=False)
+    sword_1_prev_pos: pygame.Vector2 = field(init=False)
+    sword_2_prev_pos: pygame.Vector2 = field(init=False)
 
     sword_1_target_pos: pygame.Vector2 = field(init=False)
     sword_2_target_pos: pygame.Vector2 = field(init=False)
 
-    sword_1_blit_data: tuple[pygame.Surface, pygame.typing.Point] = field(init=False)
-    sword_2_blit_data: tuple[pygame.Surface, pygame.typing.Point] = field(init=False)
+    sword_1_blit_data: tuple[pygame.Surface, pygame.Rect] = field(init=False)
+    sword_2_blit_data: tuple[pygame.Surface, pygame.Rect] = field(init=False)
 
     sword_deg: float = 0.0
     phase: int = 1
@@ -95,6 +95,8 @@ class DualTossData:
     def __post_init__(self):
         self.sword_1_pos = self.gabriel_rect.midleft - pygame.Vector2(10, 0)
         self.sword_2_pos = self.gabriel_rect.midright + pygame.Vector2(10, 0)
+        self.sword_1_prev_pos = self.sword_1_pos.copy()
+        self.sword_2_prev_pos = self.sword_2_pos.copy()
 
         dist = self.sword_1_pos.distance_to(self.anchor) + 100
         rad1 = utils.rad_to(self.sword_1_pos, self.anchor)
@@ -105,7 +107,7 @@ class DualTossData:
 
 @dataclass
 class DroppingData:
-    start: float = field(default_factory=time.perf_counter)
+    start: float = field(default_factory=utils.now)
     wait_duration: float = 0.2
     positioned: bool = False
     vel_y: float = 0.0
@@ -114,7 +116,7 @@ class DroppingData:
 
 @dataclass
 class FireballData:
-    start: float = field(default_factory=time.perf_counter)
+    start: float = field(default_factory=utils.now)
     cooldown_between_fireball: float = 0.2
     cooldown_between_streak: float = 1.0
 
@@ -143,6 +145,7 @@ class Gabriel:
     def __init__(self, pos, image: pygame.Surface) -> None:
         Gabriel.objects.append(self)
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.image = utils.load_image("assets/gabriel2.png", True, bound=True)
         self.enraged_image = utils.load_image(
             "assets/gabriel_enraged.png", True, bound=True
@@ -150,53 +153,33 @@ class Gabriel:
         dummy_rect = pygame.Rect(self.pos, (16, 16))
         self.rect = self.image.get_rect(midbottom=dummy_rect.midbottom)
         self.health = 10_000
+        self.spawned = True
+        enemies.registry.add(self)
         self.sword = utils.load_image("assets/sword.png", True, bound=True)
-        self.sway_rad = random.randint(-90, 90)
+        self.sway_rad = utils.rng.randint(-90, 90)
 
         self.enraged = False
         self.move_rng_timer = utils.Timer(5.0)
         self.attack_rng_timer = utils.Timer(3.0)
 
-    def on_bullet_collide(self, bullet):
-        self.health -= bullet.damage
-        bullet.alive = False
-
-        if bullet.coin_history:
-            points = [shared.player.collider.pos] + bullet.coin_history + [self.pos]
-            shared.fx_manager.coin_lines.append(CoinLineEffect(points))
-            shared.fx_manager.flashes.append(Flash())
-
-    def handle_damage(self):
-        for bullet in shared.shotgun_bullets + shared.pistol_bullets:
-            if self.rect.colliderect(bullet.collider_rect):
-                self.on_bullet_collide(bullet)
-
-        for blade in shared.sawblades:
-            if blade.rect.colliderect(self.rect):
-                self.health -= blade.damage
-
-        for fireball in shared.fireballs:
-            if not fireball.boosted:
-                continue
-
-            if fireball.rect.colliderect(self.rect):
-                self.health -= fireball.DAMAGE
-                fireball.alive = False
-
+    def check_health(self):
         if self.health <= 5000:
             self.enraged = True
 
         if self.health <= 0:
             try:
                 Gabriel.objects.remove(self)
-                shared.blood_splatters.append(BloodSplatter(self.rect.center, 100))
+                enemies.registry.remove(self)
+                shared.blood_splatters.append(
+                    BloodSplatter.pool.acquire(self.rect.center, 100)
+                )
                 shared.next_state = State.WIN
             except ValueError:
                 pass
 
     def rng_movement(self):
         if self.move_rng_timer.tick():
-            self.sway_rad = random.randint(-90, 90)
+            self.sway_rad = utils.rng.randint(-90, 90)
 
     def move(self):
         if self.attack not in (Attack.DROPPING, Attack.RAIN_OF_SWORDS):
@@ -213,7 +196,7 @@ class Gabriel:
         if self.enraged:
             options.append(Attack.RAIN_OF_SWORDS)
 
-        self.attack = random.choice(options)
+        self.attack = utils.rng.choice(options)
         # self.attack = Attack.RAIN_OF_SWORDS
 
         if self.attack == Attack.DROPPING:
@@ -250,11 +233,11 @@ class Gabriel:
         ):
             return
 
-        self.attack_rng_timer.time_to_pass = random.uniform(3.0, 7.0)
+        self.attack_rng_timer.time_to_pass = utils.rng.uniform(3.0, 7.0)
         self.rng_attack()
 
     def attack_dropping(self):
-        diff = time.perf_counter() - self.dropping_data.start
+        diff = utils.now() - self.dropping_data.start
         acc = 60 if self.enraged else 30
 
         if (
@@ -270,16 +253,10 @@ class Gabriel:
             self.dropping_data.vel_y += acc * shared.dt
             self.pos.y += self.dropping_data.vel_y * shared.dt
 
-            hit_tiles = False
-            for tile in Tile.objects:
-                if tile.rect.colliderect(self.rect):
-                    hit_tiles = True
-                    break
-
             if self.rect.colliderect(shared.player.collider.rect):
                 shared.player.health -= self.dropping_data.damage
                 self.rng_attack()
-            elif hit_tiles:
+            elif shared.tile_grid.any_solid(self.rect):
                 self.rng_attack()
 
     def dual_toss_phase_1(self):
@@ -333,11 +310,11 @@ class Gabriel:
         self.dual_toss_data.sword_deg += 200 * shared.dt
         self.dual_toss_data.sword_deg %= 360
 
-        sword_1_image = pygame.transform.rotate(
+        sword_1_image = utils.rotations.rotate(
             self.sword, self.dual_toss_data.sword_deg
         )
         sword_1_rect = sword_1_image.get_rect(center=self.dual_toss_data.sword_1_pos)
-        sword_2_image = pygame.transform.rotate(
+        sword_2_image = utils.rotations.rotate(
             self.sword, -self.dual_toss_data.sword_deg
         )
         sword_2_rect = sword_2_image.get_rect(center=self.dual_toss_data.sword_2_pos)
@@ -349,15 +326,8 @@ class Gabriel:
             shared.player.health -= self.dual_toss_data.damage
             self.dual_toss_data.damaged_in_phase = True
 
-        self.dual_toss_data.sword_1_blit_data = (
-            sword_1_image,
-            shared.camera.transform(sword_1_rect),
-        )
-
-        self.dual_toss_data.sword_2_blit_data = (
-            sword_2_image,
-            shared.camera.transform(sword_2_rect),
-        )
+        self.dual_toss_data.sword_1_blit_data = (sword_1_image, sword_1_rect)
+        self.dual_toss_data.sword_2_blit_data = (sword_2_image, sword_2_rect)
 
     def attack_fireballs(self):
         self.fireball_data.streak_cooldown.update()
@@ -369,7 +339,7 @@ class Gabriel:
             return
 
         shared.fireballs.append(
-            FireBall(
+            FireBall.pool.acquire(
                 self.rect.center,
                 -utils.rad_to(
                     pygame.Vector2(self.rect.center),
@@ -390,11 +360,7 @@ class Gabriel:
                 RainSword(pygame.Vector2(self.rect.center))
             )
 
-        for sword in self.rain_of_swords_data.swords[:]:
-            sword.update()
-
-            if not sword.alive:
-                self.rain_of_swords_data.swords.remove(sword)
+        self.rain_of_swords_data.swords.update()
 
     def on_attack(self):
         if self.attack == Attack.DROPPING:
@@ -406,26 +372,52 @@ class Gabriel:
         elif self.attack == Attack.RAIN_OF_SWORDS:
             self.attack_rain_of_swords()
 
+    def begin_step(self):
+        self.prev_pos.update(self.pos)
+        if self.attack == Attack.DUAL_SWORD_TOSS:
+            data = self.dual_toss_data
+            data.sword_1_prev_pos.update(data.sword_1_pos)
+            data.sword_2_prev_pos.update(data.sword_2_pos)
+        elif self.attack == Attack.RAIN_OF_SWORDS:
+            for sword in self.rain_of_swords_data.swords:
+                sword.prev_pos.update(sword.pos)
+
     def update(self):
         self.rng_movement()
         self.move()
         self.layered_rng_attack()
         self.on_attack()
-        self.handle_damage()
+
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        """Thrown and raining swords can be anywhere on screen"""
+
+        return pygame.Rect(shared.camera.offset, shared.srect.size)
+
+    def draw_sword(self, image: pygame.Surface, rect: pygame.Rect, prev_pos, pos):
+        with shared.camera.between_steps(prev_pos, pos):
+            shared.screen.blit(image, shared.camera.transform(rect))
 
     def draw(self):
-        if self.enraged:
-            shared.screen.blit(self.enraged_image, shared.camera.transform(self.rect))
-        else:
-            shared.screen.blit(self.image, shared.camera.transform(self.rect))
+        image = self.enraged_image if self.enraged else self.image
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            shared.screen.blit(image, shared.camera.transform(self.rect))
 
         if self.attack == Attack.DUAL_SWORD_TOSS and hasattr(
             self.dual_toss_data, "sword_1_blit_data"
         ):
-            shared.screen.blit(*self.dual_toss_data.sword_1_blit_data)
-            shared.screen.blit(*self.dual_toss_data.sword_2_blit_data)
+            data = self.dual_toss_data
+            self.draw_sword(
+                *data.sword_1_blit_data, data.sword_1_prev_pos, data.sword_1_pos
+            )
+            self.draw_sword(
+                *data.sword_2_blit_data, data.sword_2_prev_pos, data.sword_2_pos
+            )
         elif self.attack == Attack.RAIN_OF_SWORDS:
             for sword in self.rain_of_swords_data.swords:
-                shared.screen.blit(
-                    self.rain_of_swords_data.image, shared.camera.transform(sword.rect)
+                self.draw_sword(
+                    self.rain_of_swords_data.image,
+                    sword.rect,
+                    sword.prev_pos,
+                    sword.pos,
                 )
@@ -1,5 +1,6 @@
 from src import shared, utils
 from src.background import Background
+from src.profiler import profiler
 from src.ui import HUD, FXManager
 from src.world import World
 
@@ -18,17 +19,30 @@ class GameState:
         # pygame.mixer.music.play(loops=-1)
 
     def update(self):
-        shared.fx_manager.update()
+        shared.camera.begin_step()
+        shared.player.begin_step()
+        self.world.begin_step()
         if not shared.is_world_frozen:
-            self.background.update()
+            utils.world_clock.advance(1 / shared.SIM_RATE)
+        with profiler.section("update:fx"):
+            shared.fx_manager.update()
+        if not shared.is_world_frozen:
+            with profiler.section("update:background"):
+                self.background.update()
         self.world.update()
-        self.hud.update()
+        with profiler.section("update:hud"):
+            self.hud.update()
 
     def draw(self):
-        if shared.level_no != shared.BOSS_LEVEL:
-            self.background.draw()
-        else:
-            shared.screen.fill(shared.PALETTE["red2"])
+        shared.camera.interpolate(shared.frame_alpha)
+        with profiler.section("draw:background"):
+            if shared.level_no != shared.BOSS_LEVEL:
+                self.background.draw()
+            else:
+                shared.screen.fill(shared.PALETTE["red2"])
         self.world.draw()
-        self.hud.draw()
-        shared.fx_manager.draw()
+        with profiler.section("draw:hud"):
+            self.hud.draw()
+        with profiler.section("draw:fx"):
+            shared.fx_manager.draw()
+        shared.camera.restore()
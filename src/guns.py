@@ -1,7 +1,6 @@
 import json
 import math
 import random
-import time
 import typing as t
 from enum import Enum, auto
 
@@ -31,6 +30,7 @@ class SawbladeLauncher:
         SawbladeLauncher.objects.append(self)
         self.pos = pygame.Vector2(pos)
         self.image = utils.bound_image(image)
+        self.flipped_image = pygame.transform.flip(self.image, False, True)
         self.rect = self.image.get_rect()
         self.rect.center = pygame.Rect(
             self.pos, (shared.TILE_SIDE, shared.TILE_SIDE)
@@ -97,10 +97,11 @@ class SawbladeLauncher:
             if -90 < angle_to_mouse < 90:
                 image = self.image
             else:
-                image = pygame.transform.flip(self.image, False, True)
+                image = self.flipped_image
 
-            rotated_image = pygame.transform.rotate(image, angle_to_mouse)
-            shared.screen.blit(rotated_image, shared.camera.transform(self.rect))
+            rotated_image = utils.rotations.rotate(image, angle_to_mouse)
+            with shared.player.between_steps():
+                shared.screen.blit(rotated_image, shared.camera.transform(self.rect))
 
         elif self.state == GunState.GROUND:
             shared.screen.blit(self.image, shared.camera.transform(self.rect))
@@ -118,6 +119,7 @@ class Shotgun:
         Shotgun.objects.append(self)
         self.pos = pygame.Vector2(pos)
         self.image = utils.bound_image(image)
+        self.flipped_image = pygame.transform.flip(self.image, False, True)
         self.rect = self.image.get_rect()
         self.rect.center = pygame.Rect(
             self.pos, (shared.TILE_SIDE, shared.TILE_SIDE)
@@ -129,7 +131,7 @@ class Shotgun:
 
         self.charging_alt = False
         self.charged_amount = 0
-        self.charge_start = time.perf_counter()
+        self.charge_start = utils.now()
 
     def on_ground(self):
         pass
@@ -146,7 +148,7 @@ class Shotgun:
         angular_space = math.pi / 128
         for offset in range(-2, 3):
             shared.shotgun_bullets.append(
-                Bullet(
+                Bullet.pool.acquire(
                     (x, y),
                     angle + (offset * angular_space),
                     200,
@@ -170,9 +172,9 @@ class Shotgun:
 
         self.charging_alt = shared.mouse_press[2]
         if shared.mjp[2]:
-            self.charge_start = time.perf_counter()
+            self.charge_start = utils.now()
 
-        diff = time.perf_counter() - self.charge_start
+        diff = utils.now() - self.charge_start
         if self.charging_alt:
             self.charged_amount = (diff - 0.5) / 1.3
             self.charged_amount = min(1, self.charged_amount)
@@ -220,10 +222,11 @@ class Shotgun:
             if -90 < angle_to_mouse < 90:
                 image = self.image
             else:
-                image = pygame.transform.flip(self.image, False, True)
+                image = self.flipped_image
 
-            rotated_image = pygame.transform.rotate(image, angle_to_mouse)
-            shared.screen.blit(rotated_image, shared.camera.transform(self.rect))
+            rotated_image = utils.rotations.rotate(image, angle_to_mouse)
+            with shared.player.between_steps():
+                shared.screen.blit(rotated_image, shared.camera.transform(self.rect))
 
         elif self.state == GunState.GROUND:
             shared.screen.blit(self.image, shared.camera.transform(self.rect))
@@ -242,7 +245,8 @@ class Shotgun:
         rect.midright = (px - 5, py) + pygame.Vector2(
             shake_pixels * random.randint(-1, 1), shake_pixels * random.randint(-1, 1)
         )
-        pygame.draw.rect(shared.screen, color, shared.camera.transform(rect))
+        with shared.player.between_steps():
+            pygame.draw.rect(shared.screen, color, shared.camera.transform(rect))
 
     def draw(self):
         self.draw_gun()
@@ -258,6 +262,7 @@ class Pistol:
         Pistol.objects.append(self)
         self.pos = pygame.Vector2(pos)
         self.image = utils.bound_image(image)
+        self.flipped_image = pygame.transform.flip(self.image, False, True)
         self.rect = self.image.get_rect()
         self.rect.center = pygame.Rect(
             self.pos, (shared.TILE_SIDE, shared.TILE_SIDE)
@@ -332,10 +337,11 @@ class Pistol:
             if -90 < angle_to_mouse < 90:
                 image = self.image
             else:
-                image = pygame.transform.flip(self.image, False, True)
+                image = self.flipped_image
 
-            rotated_image = pygame.transform.rotate(image, angle_to_mouse)
-            shared.screen.blit(rotated_image, shared.camera.transform(self.rect))
+            rotated_image = utils.rotations.rotate(image, angle_to_mouse)
+            with shared.player.between_steps():
+                shared.screen.blit(rotated_image, shared.camera.transform(self.rect))
 
         elif self.state == GunState.GROUND:
             shared.screen.blit(self.image, shared.camera.transform(self.rect))
@@ -0,0 +1,84 @@
+import pygame
+
+from src import shared, utils
+
+
+def max_layer(col_edge: int, row_edge: int):
+    """Layer of a corner tile, by how far it is past either edge"""
+
+    return lambda col, row: max(abs(col - col_edge), abs(row - row_edge))
+
+
+class HellGradient:
+    """Border of tiles darkening away from the map's edges.
+
+    Tiles along an edge repeat, so each edge is a strip only a screen long,
+    blitted where the edge is on screen, plus a block per corner, instead of
+    one surface the size of the map.
+    """
+
+    LAYERS = 20
+
+    def __init__(self) -> None:
+        n = HellGradient.LAYERS
+        side = shared.TILE_SIDE
+        self.width = w = shared.tmx_map.width
+        self.height = h = shared.tmx_map.height
+        self.tiles = [
+            utils.darken_image(shared.ENTITY_CLASS_IMAGES["Tile"].copy(), 255 * (i / n))
+            for i in range(n)
+        ]
+
+        # Enough tiles to cover the screen with a partial one at each end
+        cols = shared.srect.width // side + 2
+        rows = shared.srect.height // side + 2
+        outside = range(-n + 1, 1)
+        self.left = self.build(outside, range(rows), lambda col, row: -col)
+        self.right = self.build(range(n), range(rows), lambda col, row: col)
+        self.up = self.build(range(cols), outside, lambda col, row: -row)
+        self.down = self.build(range(cols), range(n), lambda col, row: row)
+
+        # Top left tile of each corner block, with its layer at a tile
+        self.corners = [
+            ((-n + 1, -n + 1), self.build(outside, outside, max_layer(0, 0))),
+            ((w, -n + 1), self.build(range(w, w + n), outside, max_layer(w, 0))),
+            ((-n + 1, h), self.build(outside, range(h, h + n), max_layer(0, h))),
+            ((w, h), self.build(range(w, w + n), range(h, h + n), max_layer(w, h))),
+        ]
+
+    def build(self, cols: range, rows: range, layer) -> pygame.Surface:
+        side = shared.TILE_SIDE
+        surf = pygame.Surface((len(cols) * side, len(rows) * side), pygame.SRCALPHA)
+        for y, row in enumerate(rows):
+            for x, col in enumerate(cols):
+                surf.blit(self.tiles[layer(col, row)], (x * side, y * side))
+        return surf.convert_alpha()
+
+    def draw(self):
+        n = HellGradient.LAYERS
+        side = shared.TILE_SIDE
+        # Screen position of the map's top left, truncated the way blitting
+        # the whole border as one surface at a float position was
+        border = pygame.Vector2(-n * side, -n * side)
+        x, y = map(int, shared.camera.transform(border))
+        x += n * side
+        y += n * side
+
+        row_start = max(0, -y // side)
+        row_stop = min(self.height, (shared.srect.height - y - 1) // side + 1)
+        if row_stop > row_start:
+            area = (0, 0, n * side, (row_stop - row_start) * side)
+            row_y = y + row_start * side
+            shared.screen.blit(self.left, (x - (n - 1) * side, row_y), area)
+            shared.screen.blit(self.right, (x + self.width * side, row_y), area)
+
+        col_start = max(0, -x // side)
+        col_stop = min(self.width, (shared.srect.width - x - 1) // side + 1)
+        if col_stop > col_start:
+            area = (0, 0, (col_stop - col_start) * side, n * side)
+            col_x = x + col_start * side
+            shared.screen.blit(self.up, (col_x, y - (n - 1) * side), area)
+            shared.screen.blit(self.down, (col_x, y + self.height * side), area)
+
+        for (col, row), surf in self.corners:
+            shared.screen.blit(surf, (x + col * side, y + row * side))
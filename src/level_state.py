@@ -1,5 +1,3 @@
-import random
-
 import pygame
 
 from src import shared, utils
@@ -40,7 +38,7 @@ class LevelWidget:
 
     def gen_random_target_offset(self):
         self.random_target_offset = pygame.Vector2(
-            random.randint(-5, 5), random.randint(-5, 5)
+            utils.rng.randint(-5, 5), utils.rng.randint(-5, 5)
         )
 
     def draw_info(self, level_no: int, level_name: str):
@@ -98,7 +96,7 @@ class LevelWidget:
             self.gen_random_target_offset()
 
     def draw(self):
-        image = pygame.transform.scale_by(self.image, self.scale_vector.x)
+        image = utils.scales.scale_by(self.image, self.scale_vector.x)
         rect = image.get_rect(center=self.rect.center)
         # print(self.offset_vector)
         shared.screen.blit(image, self.offset_vector + rect.topleft)
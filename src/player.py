@@ -24,8 +24,9 @@ class Player:
     def __init__(self, pos, image):
         shared.player = self
         self.image = utils.bound_image(image)
-        self.collider = utils.Collider(pos, self.image.get_size())
-        utils.Collider.all_colliders.remove(self.collider)
+        self.flipped_image = pygame.transform.flip(self.image, True, False)
+        self.collider = utils.Collider(pos, self.image.get_size(), temp=True)
+        self.prev_pos = self.collider.pos
         self.gravity = utils.Gravity()
         self.coins_collected = 0
         self.last_direction: t.Literal["right", "left"] = "right"
@@ -151,6 +152,26 @@ class Player:
         if self.coin_loader_timedown.tick() and self.n_coins < Player.MAX_COINS:
             self.n_coins += 1
 
+    def begin_step(self):
+        self.prev_pos = self.collider.pos
+
+    def teleport(self, pos):
+        self.collider.pos = pos
+        self.prev_pos = self.collider.pos
+        shared.camera.cut()
+
+    @property
+    def render_rect(self) -> pygame.FRect:
+        """Collider rect between the last two simulation steps"""
+
+        pos = self.prev_pos.lerp(self.collider.pos, shared.frame_alpha)
+        return pygame.FRect(pos, self.collider.size)
+
+    def between_steps(self) -> utils.StepShift:
+        """For drawing things that follow the player, like its guns"""
+
+        return shared.camera.between_steps(self.prev_pos, self.collider.pos)
+
     def update(self):
         if self.frozen:
             return
@@ -168,25 +189,21 @@ class Player:
     def draw_fist(self):
         if self.punch_timer.is_cooling_down:
             image = self.punch_image
-            image = pygame.transform.rotate(
+            image = utils.rotations.rotate(
                 image, math.degrees(-utils.rad_to_mouse(self.collider.rect.center))
             )
-            rect = image.get_rect(center=self.collider.rect.center)
+            rect = image.get_rect(center=self.render_rect.center)
             shared.screen.blit(image, shared.camera.transform(rect))
 
     def draw(self):
-        image = (
-            self.image
-            if self.last_direction == "right"
-            else pygame.transform.flip(self.image, True, False)
-        )
+        image = self.image if self.last_direction == "right" else self.flipped_image
 
         if self.sliding:
             if self.last_direction == "right":
                 angle = 45
             else:
                 angle = -45
-            image = pygame.transform.rotate(image, angle)
+            image = utils.rotations.rotate(image, angle)
 
-        shared.screen.blit(image, shared.camera.transform(self.collider.rect))
+        shared.screen.blit(image, shared.camera.transform(self.render_rect))
         # utils.debug_rect(self.collider.rect)
@@ -0,0 +1,164 @@
+import time
+from collections import defaultdict, deque
+
+import pygame
+
+from src import shared, utils
+
+
+class Section:
+    """Context manager adding the wall time spent inside it to its name"""
+
+    __slots__ = ("totals", "name", "start")
+
+    def __init__(self, totals: dict[str, float], name: str) -> None:
+        self.totals = totals
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.totals[self.name] += time.perf_counter() - self.start
+
+
+class NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+class Profiler:
+    """Times named sections per rendered frame and keeps the last `WINDOW`
+    frames, shown as an overlay toggled with F3. Costs next to nothing while
+    hidden"""
+
+    WINDOW = 240
+    TOGGLE_KEY = pygame.K_F3
+    N_SECTIONS = 8
+    COUNTS_PER_LINE = 5
+    REFRESH_FRAMES = 15
+    GRAPH_SIZE = (240, 40)
+    GRAPH_MAX_MS = 33.3
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.totals: dict[str, float] = defaultdict(float)
+        self.sections: dict[str, Section] = {}
+        self.null_section = NullSection()
+        self.history: dict[str, deque[float]] = {}
+        self.frame_times: deque[float] = deque(maxlen=Profiler.WINDOW)
+        self.counts: dict[str, int] = {}
+        self.frame_start = time.perf_counter()
+        self.frames = 0
+        self.text: pygame.Surface | None = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frame_times.clear()
+        self.history.clear()
+        self.totals.clear()
+        self.frame_start = time.perf_counter()
+
+    def section(self, name: str) -> Section | NullSection:
+        if not self.enabled:
+            return self.null_section
+
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = Section(self.totals, name)
+        return section
+
+    def count(self, name: str, n: int):
+        if self.enabled:
+            self.counts[name] = n
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        self.frame_times.append(now - self.frame_start)
+        self.frame_start = now
+
+        for name in self.totals.keys() | self.history.keys():
+            if name not in self.history:
+                self.history[name] = deque(maxlen=Profiler.WINDOW)
+            self.history[name].append(self.totals.get(name, 0.0))
+        self.totals.clear()
+        self.frames += 1
+
+    def percentile(self, p: float) -> float:
+        times = sorted(self.frame_times)
+        return times[min(len(times) - 1, int(p / 100 * len(times)))]
+
+    def mean_ms(self, name: str) -> float:
+        history = self.history[name]
+        return sum(history) / len(history) * 1000
+
+    def render_text(self) -> pygame.Surface:
+        font = utils.load_font(None, 16)
+        lines = [
+            (
+                f"frame p50 {self.percentile(50) * 1000:.2f}"
+                f"  p95 {self.percentile(95) * 1000:.2f}"
+                f"  p99 {self.percentile(99) * 1000:.2f} ms"
+            )
+        ]
+        slowest = sorted(self.history, key=self.mean_ms, reverse=True)
+        for name in slowest[: Profiler.N_SECTIONS]:
+            lines.append(f"{self.mean_ms(name):6.2f} ms  {name}")
+        counts = [f"{name} {n}" for name, n in self.counts.items() if n]
+        for i in range(0, len(counts), Profiler.COUNTS_PER_LINE):
+            lines.append("  ".join(counts[i : i + Profiler.COUNTS_PER_LINE]))
+        lines.extend(utils.Pool.report())
+        lines.append(utils.rotations.stats())
+        lines.append(utils.scales.stats())
+
+        surfs = [font.render(line, True, "white") for line in lines]
+        text = pygame.Surface(
+            (max(s.get_width() for s in surfs), sum(s.get_height() for s in surfs)),
+            pygame.SRCALPHA,
+        )
+        text.fill((0, 0, 0, 160))
+        y = 0
+        for surf in surfs:
+            text.blit(surf, (0, y))
+            y += surf.get_height()
+        return text
+
+    def draw_graph(self, pos):
+        width, height = Profiler.GRAPH_SIZE
+        rect = pygame.Rect(pos, Profiler.GRAPH_SIZE)
+        pygame.draw.rect(shared.screen, "black", rect)
+
+        budget_y = rect.bottom - height * (1000 / 60) / Profiler.GRAPH_MAX_MS
+        for x, frame_time in enumerate(self.frame_times):
+            ratio = min(1.0, frame_time * 1000 / Profiler.GRAPH_MAX_MS)
+            color = "red" if frame_time > 1 / 60 else "green"
+            pygame.draw.line(
+                shared.screen,
+                color,
+                (rect.x + x * width / Profiler.WINDOW, rect.bottom),
+                (rect.x + x * width / Profiler.WINDOW, rect.bottom - ratio * height),
+            )
+        pygame.draw.line(
+            shared.screen, "yellow", (rect.x, budget_y), (rect.right, budget_y)
+        )
+
+    def draw(self):
+        if not self.enabled or not self.frame_times:
+            return
+
+        if self.text is None or self.frames % Profiler.REFRESH_FRAMES == 0:
+            self.text = self.render_text()
+        shared.screen.blit(self.text, (0, 0))
+        self.draw_graph((0, self.text.get_height()))
+
+
+profiler = Profiler()
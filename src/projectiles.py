@@ -1,17 +1,10 @@
 from __future__ import annotations
 
 import math
-import time
 
 import pygame
 
-from src import shared, utils
-from src.filth import Filth
-from src.gabriel import Gabriel
-from src.maurice import Maurice
-from src.soldier import Soldier
-from src.tiles import Tile
-from src.virtue import Virtue
+from src import enemies, shared, utils
 
 
 class Magnet:
@@ -19,11 +12,12 @@ class Magnet:
 
     def __init__(self, pos, radians, speed, seconds) -> None:
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.radians = radians
         self.original_speed = speed
         self.speed = speed
         self.seconds = seconds
-        self.start = time.perf_counter()
+        self.start = utils.now()
         self.direction = self.radians
         self.alive = True
         self.image = utils.load_image("assets/magnet.png", True, bound=True)
@@ -35,6 +29,7 @@ class Magnet:
         self.trail_points: list[pygame.Vector2] = []
         self.anchor_entity = None
         self.diff_from_center = pygame.Vector2()
+        self.stuck = False
 
     @classmethod
     def from_mouse(cls, pos, speed, seconds):
@@ -49,58 +44,66 @@ class Magnet:
         )
 
     def update(self):
-        if self.anchor_entity is None:
+        if self.anchor_entity is not None:
+            self.pos = (
+                pygame.Vector2(self.anchor_entity.rect.center) - self.diff_from_center
+            )
+        elif not self.stuck:
             start = self.pos.copy()
             self.dy += (shared.WORLD_GRAVITY / 8) * shared.dt
 
             self.pos += pygame.Vector2(self.dx, self.dy) * shared.dt
             self.direction = utils.rad_to(start, self.pos)
-        else:
-            self.pos = (
-                pygame.Vector2(self.anchor_entity.rect.center) - self.diff_from_center
-            )
 
         self.rect.topleft = self.pos
 
-        for obj in (
-            Filth.objects
-            + Maurice.objects
-            + Soldier.objects
-            + Virtue.objects
-            + Tile.objects
-            + Gabriel.objects
-        ):
-            if obj.rect.colliderect(self.rect) and self.anchor_entity is None:
-                self.anchor_entity = obj
+        if self.anchor_entity is None and not self.stuck:
+            touching = enemies.registry.in_rect(self.rect)
+            if touching:
+                self.anchor_entity = touching[0]
                 self.diff_from_center = self.anchor_entity.rect.center - self.pos
+            elif shared.tile_grid.any_solid(self.rect):
+                self.stuck = True
 
-        if time.perf_counter() - self.start >= self.seconds:
+        if utils.now() - self.start >= self.seconds:
             self.alive = False
 
     def draw(self):
-        image = pygame.transform.rotate(self.image, math.degrees(-self.direction))
-        shared.screen.blit(image, shared.camera.transform(self.rect))
+        image = utils.rotations.rotate(self.image, math.degrees(-self.direction))
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            shared.screen.blit(image, shared.camera.transform(self.rect))
 
 
 class Sawblade:
     ROTATE_SPEED = 1
 
+    pool = utils.Pool()
+
     def __init__(self, pos, radians, speed, seconds, damage) -> None:
+        self.reset(pos, radians, speed, seconds, damage)
+
+    def reset(self, pos, radians, speed, seconds, damage):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.radians = radians
+        self.start_radians = radians
         self.speed = speed
         self.seconds = seconds
         self.alive = True
         self.damage = damage
-        self.image = utils.load_image("assets/nail.png", True, bound=True).copy()
-        self.image = pygame.transform.rotate(self.image, -math.degrees(self.radians))
+        self.image = utils.rotations.rotate(
+            utils.load_image("assets/nail.png", True, bound=True),
+            -math.degrees(self.radians),
+        )
         self.rect = self.image.get_rect(topleft=self.pos)
-        self.start = time.perf_counter()
+        self.last_rect = self.rect.copy()
+        self.start = utils.now()
+        self.alpha = 255
         self.magnet: Magnet | None = None
 
     @classmethod
     def from_mouse(cls, pos, speed, seconds, damage):
-        return cls(
+        return cls.pool.acquire(
             pos,
             math.atan2(
                 (shared.mouse_pos[1] + shared.camera.offset.y) - pos[1],
@@ -129,7 +132,26 @@ class Sawblade:
 
         return closest_entity, closest_dist
 
+    def hits(self, rect: pygame.Rect) -> bool:
+        return utils.swept_collide(self.last_rect, self.rect, rect)
+
+    @property
+    def path_rect(self) -> pygame.Rect:
+        return self.last_rect.union(self.rect)
+
+    def check_terrain(self):
+        dx = self.rect.x - self.last_rect.x
+        dy = self.rect.y - self.last_rect.y
+        toi = shared.tile_grid.sweep(self.last_rect, dx, dy)
+        if toi is None:
+            return
+
+        self.pos.update(self.last_rect.x + dx * toi, self.last_rect.y + dy * toi)
+        self.rect.topleft = self.pos
+        self.speed = 0
+
     def update(self):
+        self.last_rect.topleft = self.rect.topleft
         if self.magnet is None:
             for magnet in shared.magnets:
                 if (
@@ -137,7 +159,7 @@ class Sawblade:
                     <= Magnet.GIGGLE_RADIUS
                 ):
                     self.magnet = magnet
-                    self.seconds = magnet.seconds - (time.perf_counter() - magnet.start)
+                    self.seconds = magnet.seconds - (utils.now() - magnet.start)
 
         if self.magnet is None:
             self.pos.x += math.cos(self.radians) * self.speed * shared.dt
@@ -155,19 +177,32 @@ class Sawblade:
 
         if self.speed <= 0:
             self.alive = False
+        elif self.magnet is None:
+            self.check_terrain()
 
-        diff = time.perf_counter() - self.start
+        diff = utils.now() - self.start
         ratio = diff / self.seconds
-        self.image.set_alpha(int(255 * (1 - ratio)))
+        self.alpha = int(255 * (1 - ratio))
         if diff > self.seconds:
             self.alive = False
 
     def draw(self):
         if self.magnet is None:
             image = self.image
+            pos = self.pos
         else:
-            image = pygame.transform.rotate(self.image, math.degrees(self.radians) + 90)
-        shared.screen.blit(image, shared.camera.transform(self.pos))
+            # One rotation from the source image rather than rotating the
+            # already rotated one, kept centred on the blade
+            image = utils.rotations.rotate(
+                utils.load_image("assets/nail.png", True, bound=True),
+                math.degrees(self.radians) + 90 - math.degrees(self.start_radians),
+            )
+            pos = image.get_rect(center=self.rect.center).topleft
+
+        # Rotations are shared between blades, so fade right before blitting
+        image.set_alpha(self.alpha)
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            shared.screen.blit(image, shared.camera.transform(pos))
 
 
 class Explosion:
@@ -175,32 +210,31 @@ class Explosion:
     DURATION = 2.0
     DAMAGE = 500
 
+    pool = utils.Pool()
+
     def __init__(self, center) -> None:
-        self.center = pygame.Vector2(center)
         self.image = utils.circle_surf(Explosion.RADIUS, shared.PALETTE["yellow"])
+        self.rect = self.image.get_rect()
+        self.reset(center)
+
+    def reset(self, center):
+        self.center = pygame.Vector2(center)
         self.image.set_alpha(150)
-        self.rect = self.image.get_rect(center=self.center)
+        self.rect.center = self.center
 
-        self.start = time.perf_counter()
+        self.start = utils.now()
         self.first = True
         self.alive = True
 
     def update(self):
         if self.first:
             shared.sounds["explosion"].play()
-            for obj in (
-                Filth.objects
-                + Maurice.objects
-                + Soldier.objects
-                + Virtue.objects
-                + Gabriel.objects
-            ):
-                if obj.rect.colliderect(self.rect):
-                    obj.health -= Explosion.DAMAGE
+            for obj in enemies.registry.in_rect(self.rect):
+                obj.health -= Explosion.DAMAGE
 
             self.first = False
 
-        diff = time.perf_counter() - self.start
+        diff = utils.now() - self.start
         amount = diff / Explosion.DURATION
 
         if amount >= 1:
@@ -219,27 +253,35 @@ class CoreEject:
     MAX_TAIL_SIZE = 15
     MAX_SIZE_SECONDS = 0.4
 
+    pool = utils.Pool()
+
     def __init__(self, pos, radians, speed, seconds) -> None:
+        self.image = utils.load_image("assets/core_eject.png", True, bound=True)
+        self.rect = self.image.get_rect()
+        self.trail_points: list[pygame.Vector2] = []
+        self.reset(pos, radians, speed, seconds)
+
+    def reset(self, pos, radians, speed, seconds):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.radians = radians
         self.original_speed = speed
         self.speed = speed
         self.seconds = seconds
-        self.start = time.perf_counter()
+        self.start = utils.now()
         self.direction = self.radians
         self.alive = True
-        self.image = utils.load_image("assets/core_eject.png", True, bound=True)
-        self.rect = self.image.get_rect()
+        self.rect.topleft = 0, 0
         self.rcenter = pygame.Vector2(self.rect.center)
 
         self.dx = math.cos(self.radians) * self.speed
         self.dy = math.sin(self.radians) * self.speed
 
-        self.trail_points: list[pygame.Vector2] = []
+        self.trail_points.clear()
 
     @classmethod
     def from_mouse(cls, pos, speed, seconds):
-        return cls(
+        return cls.pool.acquire(
             pos,
             math.atan2(
                 (shared.mouse_pos[1] + shared.camera.offset.y) - pos[1],
@@ -258,25 +300,23 @@ class CoreEject:
 
         self.pos += pygame.Vector2(self.dx, self.dy) * shared.dt
         self.direction = utils.rad_to(start, self.pos)
+        dx, dy = self.pos - start
 
-        for obj in (
-            Filth.objects
-            + Maurice.objects
-            + Soldier.objects
-            + Virtue.objects
-            + Gabriel.objects
-        ):
-            if obj.rect.colliderect(self.rect):
+        for obj in enemies.registry.in_rect(self.rect.union(self.rect.move(dx, dy))):
+            if utils.sweep_time(self.rect, dx, dy, obj.rect) is not None:
                 self.alive = False
 
-        if time.perf_counter() - self.start >= self.seconds:
+        if shared.tile_grid.sweep(self.rect, dx, dy) is not None:
+            self.alive = False
+
+        if utils.now() - self.start >= self.seconds:
             self.alive = False
 
         if not self.alive:
-            shared.explosions.append(Explosion(self.rect.center))
+            shared.explosions.append(Explosion.pool.acquire(self.rect.center))
 
     def points(self) -> list[pygame.Vector2]:
-        ratio = min(1, (time.perf_counter() - self.start) / CoreEject.MAX_SIZE_SECONDS)
+        ratio = min(1, (utils.now() - self.start) / CoreEject.MAX_SIZE_SECONDS)
         tail_size = CoreEject.MAX_TAIL_SIZE * ratio
 
         head = self.pos.copy()
@@ -294,35 +334,47 @@ class CoreEject:
         return [left_wing, head, right_wing, tail]
 
     def draw(self):
-        points = self.points()
-        pygame.draw.polygon(
-            shared.screen,
-            shared.PALETTE["yellow"],
-            [shared.camera.transform(pos) for pos in points],
-        )
-        self.rect.center = utils.get_mid_point(points[0], points[2])
-        shared.screen.blit(self.image, shared.camera.transform(self.rect))
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            points = self.points()
+            pygame.draw.polygon(
+                shared.screen,
+                shared.PALETTE["yellow"],
+                [shared.camera.transform(pos) for pos in points],
+            )
+            self.rect.center = utils.get_mid_point(points[0], points[2])
+            shared.screen.blit(self.image, shared.camera.transform(self.rect))
 
 
 class Bullet:
+    pool = utils.Pool()
+
     def __init__(self, pos, radians, speed, seconds, damage) -> None:
+        self.collider_rect = pygame.Rect(0, 0, 10, 10)
+        self.last_rect = self.collider_rect.copy()
+        self.coin_history: list[pygame.Vector2] = []
+        self.reset(pos, radians, speed, seconds, damage)
+
+    def reset(self, pos, radians, speed, seconds, damage):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.radians = radians
         self.speed = speed
-        self.collider_rect = pygame.Rect(self.pos, (10, 10))
+        self.collider_rect.center = self.pos
+        self.last_rect.topleft = self.collider_rect.topleft
         self.seconds = seconds
         self.alive = True
         self.target: pygame.Vector2 | None = None
+        self.target_entity = None
         self.base_damage = damage
         self.damage = damage
 
-        self.coin_history: list[pygame.Vector2] = []
+        self.coin_history.clear()
 
-        self.start = time.perf_counter()
+        self.start = utils.now()
 
     @classmethod
     def from_mouse(cls, pos, speed, seconds, damage):
-        return cls(
+        return cls.pool.acquire(
             pos,
             math.atan2(
                 (shared.mouse_pos[1] + shared.camera.offset.y) - pos[1],
@@ -351,30 +403,63 @@ class Bullet:
 
         return closest_entity, closest_dist
 
+    def hits(self, rect: pygame.Rect) -> bool:
+        return utils.swept_collide(self.last_rect, self.collider_rect, rect)
+
+    @property
+    def path_rect(self) -> pygame.Rect:
+        return self.last_rect.union(self.collider_rect)
+
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        return self.collider_rect
+
+    def check_terrain(self):
+        dx = self.collider_rect.x - self.last_rect.x
+        dy = self.collider_rect.y - self.last_rect.y
+        toi = shared.tile_grid.sweep(self.last_rect, dx, dy)
+        if toi is None:
+            return
+
+        self.collider_rect.topleft = (
+            self.last_rect.x + dx * toi,
+            self.last_rect.y + dy * toi,
+        )
+        self.pos.update(self.collider_rect.center)
+        self.speed = 0
+
     def update(self):
+        self.last_rect.topleft = self.collider_rect.topleft
         if self.target is None:
             self.pos.x += math.cos(self.radians) * self.speed * shared.dt
             self.pos.y += math.sin(self.radians) * self.speed * shared.dt
         else:
+            # Enemy positions are read as copies, so follow a live target by
+            # reading it every step, and its last position once it dies
+            if self.target_entity in enemies.registry:
+                self.target = self.target_entity.pos
             self.pos.move_towards_ip(self.target, self.speed * shared.dt)
 
         self.collider_rect.center = self.pos
 
         if self.speed <= 0:
             self.alive = False
+        else:
+            self.check_terrain()
 
-        if (time.perf_counter() - self.start) > self.seconds:
+        if (utils.now() - self.start) > self.seconds:
             self.alive = False
 
     def draw(self):
-        pygame.draw.line(
-            shared.screen,
-            shared.PALETTE["yellow"],
-            shared.camera.transform(self.pos),
-            shared.camera.transform(
-                utils.move_towards_rad(self.pos, -self.radians, 10)
-            ),
-        )
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            pygame.draw.line(
+                shared.screen,
+                shared.PALETTE["yellow"],
+                shared.camera.transform(self.pos),
+                shared.camera.transform(
+                    utils.move_towards_rad(self.pos, -self.radians, 10)
+                ),
+            )
 
         # utils.debug_rect(self.coin_collide_rect)
 
@@ -383,27 +468,35 @@ class Coin:
     MAX_TAIL_SIZE = 15
     MAX_SIZE_SECONDS = 1.0
 
+    pool = utils.Pool()
+
     def __init__(self, pos, radians, speed, seconds) -> None:
+        self.image = utils.load_image("assets/coin.png", True, bound=True)
+        self.rect = self.image.get_rect()
+        self.trail_points: list[pygame.Vector2] = []
+        self.reset(pos, radians, speed, seconds)
+
+    def reset(self, pos, radians, speed, seconds):
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos.copy()
         self.radians = radians
         self.original_speed = speed
         self.speed = speed
         self.seconds = seconds
-        self.start = time.perf_counter()
+        self.start = utils.now()
         self.direction = self.radians
         self.alive = True
-        self.image = utils.load_image("assets/coin.png", True, bound=True)
-        self.rect = self.image.get_rect()
+        self.rect.topleft = 0, 0
         self.rcenter = pygame.Vector2(self.rect.center)
 
         self.dx = math.cos(self.radians) * self.speed
         self.dy = math.sin(self.radians) * self.speed
 
-        self.trail_points: list[pygame.Vector2] = []
+        self.trail_points.clear()
 
     @classmethod
     def from_mouse(cls, pos, speed, seconds):
-        return cls(
+        return cls.pool.acquire(
             pos,
             math.atan2(
                 (shared.mouse_pos[1] + shared.camera.offset.y) - pos[1],
@@ -415,32 +508,33 @@ class Coin:
 
     def redirect_to_enemy(self, target, bullet):
         bullet.target = target.pos
+        bullet.target_entity = target
         bullet.damage += bullet.base_damage
         bullet.radians = utils.rad_to(bullet.pos, target.pos)
 
     def redirect_to_coin(self, coin, bullet):
         bullet.target = coin.pos
+        bullet.target_entity = None
         bullet.radians = utils.rad_to(bullet.pos, coin.rcenter)
         bullet.damage += bullet.base_damage
         bullet.coin_history.append(coin.pos)
 
+    def visible_from(self, bullet, entities) -> list:
+        return [
+            entity
+            for entity in entities
+            if utils.has_line_of_sight(shared.tile_grid, bullet.pos, entity.pos)
+        ]
+
     def on_bullet_collide(self):
         for bullet in shared.pistol_bullets:
-            if self.rect.colliderect(bullet.collider_rect):
+            if bullet.hits(self.rect):
                 closest_coin = bullet.get_closest_entity(
-                    shared.coins,
+                    self.visible_from(bullet, shared.coins),
                     reject=self,  # type: ignore
                 )
                 closest_target = bullet.get_closest_entity(
-                    [
-                        obj
-                        for obj in Filth.objects
-                        + Virtue.objects
-                        + Soldier.objects
-                        + Maurice.objects
-                        + Gabriel.objects
-                        if obj.spawner.activated
-                    ]
+                    self.visible_from(bullet, enemies.registry.active)
                 )
 
                 if closest_coin is not None:
@@ -476,11 +570,14 @@ class Coin:
         self.pos += pygame.Vector2(self.dx, self.dy) * shared.dt
         self.direction = utils.rad_to(start, self.pos)
 
-        if time.perf_counter() - self.start >= self.seconds:
+        if shared.tile_grid.sweep(self.rect, *(self.pos - start)) is not None:
+            self.alive = False
+
+        if utils.now() - self.start >= self.seconds:
             self.alive = False
 
     def points(self) -> list[pygame.Vector2]:
-        ratio = min(1, (time.perf_counter() - self.start) / Coin.MAX_SIZE_SECONDS)
+        ratio = min(1, (utils.now() - self.start) / Coin.MAX_SIZE_SECONDS)
         tail_size = Coin.MAX_TAIL_SIZE * ratio
 
         head = self.pos.copy()
@@ -498,11 +595,12 @@ class Coin:
         return [left_wing, head, right_wing, tail]
 
     def draw(self):
-        points = self.points()
-        pygame.draw.polygon(
-            shared.screen,
-            "white",
-            [shared.camera.transform(pos) for pos in points],
-        )
-        self.rect.center = utils.get_mid_point(points[0], points[2])
-        shared.screen.blit(self.image, shared.camera.transform(self.rect))
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            points = self.points()
+            pygame.draw.polygon(
+                shared.screen,
+                "white",
+                [shared.camera.transform(pos) for pos in points],
+            )
+            self.rect.center = utils.get_mid_point(points[0], points[2])
+            shared.screen.blit(self.image, shared.camera.transform(self.rect))
@@ -0,0 +1,104 @@
+import json
+import struct
+
+import pygame
+
+from src import shared, utils
+
+MAGIC = b"RIOT"
+# Mouse x, y, then held / just pressed / just released buttons as bitmasks,
+# then how many key codes follow for held / just pressed / just released keys
+STEP = struct.Struct("<hhBBBBBB")
+KEY = struct.Struct("<I")
+HEADER_SIZE = struct.Struct("<I")
+
+
+def pack_buttons(buttons) -> int:
+    return sum(1 << i for i, pressed in enumerate(buttons) if pressed)
+
+
+def unpack_buttons(mask: int) -> tuple[bool, ...]:
+    return tuple(bool(mask >> i & 1) for i in range(5))
+
+
+class InputRecorder:
+    """Writes the input each simulation step sees, after a header holding
+    what is needed to start the same session again. Use it in a `with` so the
+    file is flushed and closed however the session ends"""
+
+    def __init__(self, path: str, seed: int, level_no: int | None) -> None:
+        self.file = open(path, "wb")
+        header = json.dumps(
+            {"seed": seed, "level_no": level_no, "save_data": shared.save_data}
+        ).encode()
+        self.file.write(MAGIC + HEADER_SIZE.pack(len(header)) + header)
+
+    def record(self):
+        key_groups = (shared.keys.keys, shared.kp.keys, shared.kr.keys)
+        self.file.write(
+            STEP.pack(
+                int(shared.mouse_pos[0]),
+                int(shared.mouse_pos[1]),
+                pack_buttons(shared.mouse_press),
+                pack_buttons(shared.mjp),
+                pack_buttons(shared.mjr),
+                *map(len, key_groups),
+            )
+        )
+        for keys in key_groups:
+            for key in keys:
+                self.file.write(KEY.pack(key))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self) -> "InputRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class InputPlayer:
+    """Feeds a recording back into `shared` one simulation step at a time"""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self.data = f.read()
+
+        if not self.data.startswith(MAGIC):
+            raise ValueError(f"{path} is not an input recording")
+
+        (size,) = HEADER_SIZE.unpack_from(self.data, len(MAGIC))
+        self.offset = len(MAGIC) + HEADER_SIZE.size
+        header = json.loads(self.data[self.offset : self.offset + size])
+        self.offset += size
+
+        self.seed: int = header["seed"]
+        self.level_no: int | None = header["level_no"]
+        self.save_data: dict = header["save_data"]
+
+    def play(self) -> bool:
+        """Puts the next step's input into `shared`, False once it ran out"""
+
+        if self.offset >= len(self.data):
+            return False
+
+        x, y, press, jp, jr, *counts = STEP.unpack_from(self.data, self.offset)
+        self.offset += STEP.size
+        shared.mouse_pos = pygame.Vector2(x, y)
+        shared.mouse_press = unpack_buttons(press)
+        shared.mjp = unpack_buttons(jp)
+        shared.mjr = unpack_buttons(jr)
+
+        key_groups = []
+        for count in counts:
+            keys = [
+                KEY.unpack_from(self.data, self.offset + i * KEY.size)[0]
+                for i in range(count)
+            ]
+            self.offset += count * KEY.size
+            key_groups.append(utils.KeySet(keys))
+        shared.keys, shared.kp, shared.kr = key_groups
+        shared.events = []
+        return True
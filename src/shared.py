@@ -6,6 +6,7 @@ import pygame
 import pytmx
 
 if t.TYPE_CHECKING:
+    from src.active_region import ActiveRegion
     from src.blood_splatter import BloodSplatter
     from src.checkpoint import Checkpoint
     from src.enums import State
@@ -13,7 +14,7 @@ if t.TYPE_CHECKING:
     from src.player import Player
     from src.projectiles import Bullet, Coin, CoreEject, Explosion, Magnet, Sawblade
     from src.ui import FXManager
-    from src.utils import Camera
+    from src.utils import Camera, KeySet, TileGrid
 
 # Const
 TILE_SIDE = 16
@@ -29,6 +30,13 @@ PALETTE: dict[t.Literal["purple", "grey", "black", "yellow", "red", "red2"], str
 }
 ENTITY_CLASS_IMAGES: dict[str, pygame.Surface] = {}
 BOSS_LEVEL = 4
+SIM_RATE = 120
+# Game seconds per real second; the old variable step ran dt >= 0.1 at 60 FPS
+TIME_SCALE = 6.0
+# Game seconds per frame of the old variable step, for damage dealt per frame
+FRAME_DT = 0.1
+MAX_STEPS_PER_FRAME = 8
+ACTIVE_REGION_MARGIN = TILE_SIDE * 8
 
 # Canvas
 screen: pygame.Surface
@@ -41,20 +49,25 @@ mouse_pos: pygame.Vector2
 mouse_press: tuple[int, ...]
 mjr: tuple[bool, ...]
 mjp: tuple[bool, ...]
-keys: list[bool]
-kp: list[bool]
-kr: list[bool]
+keys: KeySet
+kp: KeySet
+kr: KeySet
 dt: float
+frame_alpha: float
 clock: pygame.Clock
 
 # States
 next_state: State | None
 level_no: int
+# Loaded instead of the level's own map when set
+map_path: str | None = None
 
 # Objects
 player: Player
 tmx_map: pytmx.TiledMap
+tile_grid: TileGrid
 fx_manager: FXManager
+active_region: ActiveRegion
 pistol_bullets: list[Bullet]
 shotgun_bullets: list[Bullet]
 sawblades: list[Sawblade]
@@ -73,8 +86,13 @@ is_world_frozen: bool
 save_data: dict
 
 # Sounds
-pygame.mixer.init()
-roll = ["checkpoint", "explosion", "jump", "sawblade", "pistol", "shotgun", "coin"]
-sounds: dict[str, pygame.Sound] = {
-    name: pygame.Sound(f"assets/sounds/{name}.wav") for name in roll
-}
+SOUND_NAMES = [
+    "checkpoint",
+    "explosion",
+    "jump",
+    "sawblade",
+    "pistol",
+    "shotgun",
+    "coin",
+]
+sounds: dict[str, pygame.Sound]
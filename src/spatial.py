@@ -34,7 +34,7 @@ class Portal:
                 getattr(self.other.rect, self.other.side),
             )
 
-            shared.player.collider.pos = pygame.Vector2(rect.topleft)
+            shared.player.teleport(rect.topleft)
 
     def draw(self):
         shared.screen.blit(self.image, shared.camera.transform(self.pos))
@@ -2,7 +2,7 @@ import typing as t
 
 import pygame
 
-from src import shared, utils
+from src import enemies, shared, utils
 
 
 class EntitySpawner:
@@ -12,11 +12,25 @@ class EntitySpawner:
         self.pos = pygame.Vector2(pos)
         self.rect = pygame.Rect(self.pos, (width, height))
         self.activated = False
+        self.sleeping: list = []
         EntitySpawner.objects.append(self)
 
     def update(self):
+        if self.activated:
+            return
+
         if shared.player.collider.rect.colliderect(self.rect):
-            self.activated = True
+            self.activate()
+
+    def activate(self):
+        """Moves the sleeping entities onto their type's update list"""
+
+        self.activated = True
+        for entity in self.sleeping:
+            type(entity).objects.append(entity)
+            enemies.activate(entity.row)
+            enemies.registry.add(entity)
+        self.sleeping.clear()
 
     def draw(self):
         utils.debug_rect(self.rect)
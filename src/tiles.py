@@ -9,7 +9,9 @@ class Tile:
 
     def __init__(self, pos, image):
         self.pos = pos
-        self.collider = utils.Collider(pos, (shared.TILE_SIDE, shared.TILE_SIDE))
+        self.collider = utils.Collider(
+            pos, (shared.TILE_SIDE, shared.TILE_SIDE), temp=True
+        )
         Tile.objects.append(self)
         self.image = image
         self.rect = self.collider.rect
@@ -1,5 +1,4 @@
 import math
-import time
 import typing as t
 
 import pygame
@@ -45,14 +44,14 @@ class Flash:
     def __init__(self, duration: float = 0.7) -> None:
         shared.is_world_frozen = True
         self.alive = True
-        self.start = time.perf_counter()
+        self.start = utils.sim_clock.time
         self.image = pygame.Surface(shared.srect.size, pygame.SRCALPHA)
         self.image.fill("white")
         self.image.set_alpha(50)
         self.duration = duration
 
     def update(self):
-        if time.perf_counter() - self.start >= self.duration:
+        if utils.sim_clock.time - self.start >= self.duration:
             shared.is_world_frozen = False
             self.alive = False
 
@@ -63,11 +62,11 @@ class Flash:
 class CoinLineEffect:
     def __init__(self, coin_history: list[pygame.Vector2]) -> None:
         self.coin_history = coin_history
-        self.start = time.perf_counter()
+        self.start = utils.sim_clock.time
         self.alive = True
 
     def update(self):
-        if time.perf_counter() - self.start > shared.fx_manager.flashes[0].duration:
+        if utils.sim_clock.time - self.start > shared.fx_manager.flashes[0].duration:
             self.alive = False
 
     def draw(self):
@@ -83,21 +82,12 @@ class CoinLineEffect:
 
 class FXManager:
     def __init__(self) -> None:
-        self.coin_lines: list[CoinLineEffect] = []
-        self.flashes: list[Flash] = []
+        self.coin_lines = utils.EntityList()
+        self.flashes = utils.EntityList()
 
     def update(self):
-        for line in self.coin_lines[:]:
-            line.update()
-
-            if not line.alive:
-                self.coin_lines.remove(line)
-
-        for flash in self.flashes[:]:
-            flash.update()
-
-            if not flash.alive:
-                self.flashes.remove(flash)
+        self.coin_lines.update()
+        self.flashes.update()
 
     def draw(self):
         for line in self.coin_lines:
@@ -138,7 +128,7 @@ class NCoinsIndicator:
 
     def update(self):
         if shared.player.n_coins < shared.player.MAX_COINS:
-            diff = time.perf_counter() - shared.player.coin_loader_timedown.start
+            diff = utils.now() - shared.player.coin_loader_timedown.start
             self.amount_loaded = diff / shared.player.coin_loader_timedown.time_to_pass
         else:
             self.amount_loaded = 1.0
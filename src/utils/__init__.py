@@ -1,8 +1,17 @@
-from .camera import Camera
+from .camera import Camera, StepShift
+from .chunks import *
 from .client import LocalBroadcastClient, UDPClient
+from .clock import *
 from .collision import *
 from .components import *
+from .culling import *
+from .ecs import *
 from .entities import *
+from .grid import *
+from .input import *
 from .misc import *
+from .pool import *
+from .raycast import *
 from .server import LocalBroadcastServer, UDPServer
+from .sprite_cache import *
 from .ui import *
@@ -3,6 +3,24 @@ import pygame
 from src import shared
 
 
+class StepShift:
+    """Moves the camera offset by `shift` while inside the `with`"""
+
+    __slots__ = ("offset", "saved", "shift")
+
+    def __init__(self, offset: pygame.Vector2) -> None:
+        self.offset = offset
+        self.saved = pygame.Vector2()
+        self.shift = pygame.Vector2()
+
+    def __enter__(self):
+        self.saved.update(self.offset)
+        self.offset += self.shift
+
+    def __exit__(self, *exc):
+        self.offset.update(self.saved)
+
+
 class Camera:
     def __init__(
         self,
@@ -16,7 +34,11 @@ class Camera:
         self.top_bounds = top_bounds
         self.bottom_bounds = bottom_bounds
         self.offset = pygame.Vector2()
+        self.prev_offset = pygame.Vector2()
+        self.sim_offset = pygame.Vector2()
+        self.cutting = False
         self.rect = pygame.Rect(0, 0, shared.srect.width, shared.srect.height)
+        self.step_shift = StepShift(self.offset)
 
     def attach_to(self, pos, smoothness_factor=0.08):
         self.offset.x += (
@@ -47,6 +69,39 @@ class Camera:
             if offset.y > self.bottom_bounds - shared.srect.height:
                 offset.y = self.bottom_bounds - shared.srect.height
 
+    def begin_step(self):
+        self.prev_offset.update(self.offset)
+        self.cutting = False
+
+    def cut(self):
+        """Skips interpolating into this step, for jumps like teleports"""
+
+        self.cutting = True
+
+    def interpolate(self, alpha: float):
+        """Moves the offset between the last two simulation steps for
+        drawing, until `restore` is called"""
+
+        self.sim_offset.update(self.offset)
+        if self.cutting:
+            alpha = 1.0
+        self.offset.update(self.prev_offset.lerp(self.offset, alpha))
+        self.rect.topleft = self.offset
+
+    def between_steps(self, prev_pos, pos) -> StepShift:
+        """Context in which anything drawn relative to `pos` lands between
+        `prev_pos` and `pos`, as the camera does between steps"""
+
+        back = 1 - shared.frame_alpha
+        self.step_shift.shift.update(
+            (pos[0] - prev_pos[0]) * back, (pos[1] - prev_pos[1]) * back
+        )
+        return self.step_shift
+
+    def restore(self):
+        self.offset.update(self.sim_offset)
+        self.rect.topleft = self.offset
+
     def transform(self, pos) -> pygame.Vector2 | pygame.Rect | pygame.FRect:
         if isinstance(pos, pygame.Rect) or isinstance(pos, pygame.FRect):
             return pos.move(*-self.offset)
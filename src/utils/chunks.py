@@ -0,0 +1,45 @@
+import math
+
+import pygame
+
+from src import shared
+
+
+class ChunkedLayer:
+    """Static images baked at load into fixed-size chunk surfaces, so drawing
+    costs one blit per chunk on screen however many images went in"""
+
+    def __init__(self, chunk_size: int = 256) -> None:
+        self.chunk_size = chunk_size
+        self.chunks: dict[tuple[int, int], pygame.Surface] = {}
+
+    def add(self, image: pygame.Surface, pos):
+        size = self.chunk_size
+        rect = image.get_rect(topleft=(int(pos[0]), int(pos[1])))
+        for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for col in range(rect.left // size, (rect.right - 1) // size + 1):
+                chunk = self.chunks.get((col, row))
+                if chunk is None:
+                    chunk = pygame.Surface((size, size), pygame.SRCALPHA)
+                    self.chunks[col, row] = chunk
+                chunk.blit(image, (rect.x - col * size, rect.y - row * size))
+
+    def bake(self):
+        """Converts the chunks for fast blitting once everything is added"""
+
+        for key, chunk in self.chunks.items():
+            self.chunks[key] = chunk.convert_alpha()
+
+    def draw(self):
+        size = self.chunk_size
+        view = shared.camera.rect
+        for row in range(view.top // size, (view.bottom - 1) // size + 1):
+            for col in range(view.left // size, (view.right - 1) // size + 1):
+                chunk = self.chunks.get((col, row))
+                if chunk is None:
+                    continue
+
+                # Floored like the per-image blits were for positive
+                # offsets, since chunk corners are often off to the left
+                x, y = shared.camera.transform((col * size, row * size))
+                shared.screen.blit(chunk, (math.floor(x), math.floor(y)))
@@ -0,0 +1,19 @@
+class SimClock:
+    """Simulated seconds, advanced by the main loop one step at a time
+    instead of following the wall clock"""
+
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def advance(self, seconds: float):
+        self.time += seconds
+
+
+# Runs every simulation step
+sim_clock = SimClock()
+# Only runs while the world isn't frozen, gameplay timers read this one
+world_clock = SimClock()
+
+
+def now() -> float:
+    return world_clock.time
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -22,68 +23,318 @@ class CollisionData:
     colliders: dict[CollisionSide, Collider]
 
 
+def sweep_time(
+    rect: pygame.Rect | pygame.FRect,
+    dx: float,
+    dy: float,
+    target: pygame.Rect | pygame.FRect,
+) -> float | None:
+    """Fraction of the move (dx, dy) after which `rect` first overlaps `target`.
+    None if it never does, 0.0 if they already overlap"""
+
+    entry, exit = 0.0, 1.0
+    for start, size, delta, target_start, target_size in (
+        (rect.left, rect.width, dx, target.left, target.width),
+        (rect.top, rect.height, dy, target.top, target.height),
+    ):
+        if delta == 0:
+            if start >= target_start + target_size or start + size <= target_start:
+                return None
+            continue
+
+        near = (target_start - (start + size)) / delta
+        far = (target_start + target_size - start) / delta
+        if near > far:
+            near, far = far, near
+
+        entry = max(entry, near)
+        exit = min(exit, far)
+        if entry >= exit:
+            return None
+
+    return entry
+
+
+def swept_collide(
+    start: pygame.Rect | pygame.FRect,
+    end: pygame.Rect | pygame.FRect,
+    target: pygame.Rect | pygame.FRect,
+) -> bool:
+    """Whether a rect moving from `start` to `end` touches `target` on the way"""
+
+    return sweep_time(start, end.x - start.x, end.y - start.y, target) is not None
+
+
+class SpatialHash:
+    """Buckets items into uniform cells so queries only visit nearby ones"""
+
+    def __init__(self, cell_size: int) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list] = {}
+        self.insertion_order: dict[t.Any, int] = {}
+        self.n_inserted = 0
+
+    def cells_for(
+        self, rect: pygame.Rect | pygame.FRect
+    ) -> t.Iterator[tuple[int, int]]:
+        size = self.cell_size
+        left = int(rect.left // size)
+        top = int(rect.top // size)
+        right = int(rect.right // size)
+        bottom = int(rect.bottom // size)
+
+        for row in range(top, bottom + 1):
+            for col in range(left, right + 1):
+                yield col, row
+
+    def insert(self, item, rect: pygame.Rect | pygame.FRect):
+        self.insertion_order[item] = self.n_inserted
+        self.n_inserted += 1
+        for cell in self.cells_for(rect):
+            self.cells.setdefault(cell, []).append(item)
+
+    def remove(self, item, rect: pygame.Rect | pygame.FRect):
+        self.insertion_order.pop(item, None)
+        for cell in self.cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket is None or item not in bucket:
+                continue
+
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, rect: pygame.Rect | pygame.FRect) -> list:
+        """Items sharing a cell with `rect`, each listed once in insertion order"""
+
+        found = set()
+        for cell in self.cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                found.update(bucket)
+
+        return sorted(found, key=self.insertion_order.__getitem__)
+
+    def clear(self):
+        self.cells.clear()
+        self.insertion_order.clear()
+        self.n_inserted = 0
+
+
+class ColliderStore:
+    """Struct-of-arrays storage for the rects and flags of every collider"""
+
+    ALIVE = 1
+    STATIC = 2
+
+    def __init__(self) -> None:
+        self.x = array("d")
+        self.y = array("d")
+        self.w = array("d")
+        self.h = array("d")
+        self.flags = array("B")
+        self.owners: list[Collider | None] = []
+        self.free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.owners) - len(self.free)
+
+    def add(self, owner: Collider, pos, size, flags: int) -> int:
+        if self.free:
+            index = self.free.pop()
+            self.x[index], self.y[index] = pos
+            self.w[index], self.h[index] = size
+            self.flags[index] = flags
+            self.owners[index] = owner
+            return index
+
+        self.x.append(pos[0])
+        self.y.append(pos[1])
+        self.w.append(size[0])
+        self.h.append(size[1])
+        self.flags.append(flags)
+        self.owners.append(owner)
+        return len(self.owners) - 1
+
+    def release(self, index: int):
+        self.flags[index] = 0
+        self.owners[index] = None
+        self.free.append(index)
+
+    def clear(self):
+        for column in (self.x, self.y, self.w, self.h, self.flags):
+            del column[:]
+        self.owners.clear()
+        self.free.clear()
+
+    def overlapping(
+        self,
+        rect: pygame.Rect | pygame.FRect,
+        indices: t.Iterable[int] | None = None,
+        mask: int = STATIC,
+    ) -> array:
+        """Indices of stored rects with any of `mask` set that overlap `rect`,
+        testing only `indices` if given and every slot otherwise"""
+
+        left, top, width, height = rect
+        if width <= 0 or height <= 0:
+            return array("l")
+        right = left + width
+        bottom = top + height
+
+        xs, ys, ws, hs, flags = self.x, self.y, self.w, self.h, self.flags
+        found = array("l")
+        for i in range(len(flags)) if indices is None else indices:
+            if (
+                flags[i] & mask
+                and xs[i] < right
+                and xs[i] + ws[i] > left
+                and ys[i] < bottom
+                and ys[i] + hs[i] > top
+            ):
+                found.append(i)
+
+        return found
+
+    def overlapping_many(
+        self,
+        rects: t.Iterable[pygame.Rect | pygame.FRect],
+        grid: SpatialHash | None = None,
+        mask: int = STATIC,
+    ) -> list[array]:
+        """`overlapping` for each of `rects`, narrowed by `grid` if given"""
+
+        return [
+            self.overlapping(rect, None if grid is None else grid.query(rect), mask)
+            for rect in rects
+        ]
+
+
 class Collider:
-    """Have as attribute to entity"""
+    """Have as attribute to entity
+
+    The rect lives in `Collider.store` at `index`; this is a view onto it.
+    Registered colliders are hashed once on creation and treated as static.
+    Call `remove` before moving one around.
+    """
 
-    all_colliders: list[t.Self] = []
-    temp_colliders: list[t.Self] = []
+    store = ColliderStore()
+    grid = SpatialHash(shared.TILE_SIDE)
 
     def __init__(self, pos, size, temp: bool = False) -> None:
-        self.pos = pygame.Vector2(pos)
-        self.size = size
+        flags = ColliderStore.ALIVE
         if not temp:
-            Collider.all_colliders.append(self)
+            flags |= ColliderStore.STATIC
+
+        self.index = Collider.store.add(self, pos, size, flags)
+        if not temp:
+            Collider.grid.insert(self.index, self.rect)
+
+    @classmethod
+    def clear_all(cls):
+        cls.store.clear()
+        cls.grid.clear()
+
+    @property
+    def x(self) -> float:
+        return Collider.store.x[self.index]
+
+    @x.setter
+    def x(self, value: float):
+        Collider.store.x[self.index] = value
+
+    @property
+    def y(self) -> float:
+        return Collider.store.y[self.index]
+
+    @y.setter
+    def y(self, value: float):
+        Collider.store.y[self.index] = value
+
+    @property
+    def pos(self) -> pygame.Vector2:
+        return pygame.Vector2(self.x, self.y)
+
+    @pos.setter
+    def pos(self, value):
+        self.x, self.y = value
+
+    @property
+    def size(self) -> tuple[float, float]:
+        return Collider.store.w[self.index], Collider.store.h[self.index]
 
     @property
     def rect(self) -> pygame.FRect:
-        return pygame.FRect(self.pos, self.size)
+        return pygame.FRect(self.x, self.y, *self.size)
+
+    def remove(self):
+        store = Collider.store
+        if store.owners[self.index] is not self:
+            return
+
+        if store.flags[self.index] & ColliderStore.STATIC:
+            Collider.grid.remove(self.index, self.rect)
+        store.release(self.index)
+
+    def get_nearby(self, area: pygame.FRect) -> list[int]:
+        return Collider.grid.query(area)
 
     def get_collision_data(self, dx, dy) -> CollisionData:
         """Returns datapacket containing collisiondata"""
 
+        store = Collider.store
+        xs, ys, ws, hs = store.x, store.y, store.w, store.h
         colliders = defaultdict(list)
         possible_x = []
         possible_y = []
 
-        for collider in Collider.all_colliders + Collider.temp_colliders:
-            if collider is self:
+        x, y = self.x, self.y
+        width, height = self.size
+        moved_x = pygame.FRect(x + dx, y, width, height)
+        moved_y = pygame.FRect(x, y + dy, width, height)
+        nearby = self.get_nearby(moved_x.union(moved_y))
+        hits_x = set(store.overlapping(moved_x, nearby))
+        hits_y = set(store.overlapping(moved_y, nearby))
+
+        for i in nearby:
+            if i == self.index:
                 continue
 
-            is_colliding_x = self.rect.move(dx, 0).colliderect(collider.rect)
-            is_colliding_y = self.rect.move(0, dy).colliderect(collider.rect)
+            is_colliding_x = i in hits_x
+            is_colliding_y = i in hits_y
 
             side = None
             if is_colliding_x and dx < 0:
-                possible_x.append(collider.rect.right)
+                possible_x.append(xs[i] + ws[i])
                 side = CollisionSide.LEFT
             elif is_colliding_x and dx > 0:
-                possible_x.append(collider.pos.x - self.size[0])
+                possible_x.append(xs[i] - width)
                 side = CollisionSide.RIGHT
 
             if is_colliding_y and dy < 0:
-                possible_y.append(collider.rect.bottom)
+                possible_y.append(ys[i] + hs[i])
                 side = CollisionSide.TOP
             elif is_colliding_y and dy > 0:
-                possible_y.append(collider.pos.y - self.size[1])
+                possible_y.append(ys[i] - height)
                 side = CollisionSide.BOTTOM
 
             if side is not None:
-                colliders[side].append(collider)
+                colliders[side].append(store.owners[i])
 
         if possible_x:
             if dx < 0:
-                self.pos.x = max(possible_x)
+                self.x = max(possible_x)
             else:
-                self.pos.x = min(possible_x)
+                self.x = min(possible_x)
 
         if possible_y:
             if dy < 0:
-                self.pos.y = max(possible_y)
+                self.y = max(possible_y)
             else:
-                self.pos.y = min(possible_y)
+                self.y = min(possible_y)
 
-        x_index = possible_x.index(self.pos.x) if possible_x else None
-        y_index = possible_y.index(self.pos.y) if possible_y else None
+        x_index = possible_x.index(self.x) if possible_x else None
+        y_index = possible_y.index(self.y) if possible_y else None
 
         snapped = {}
 
@@ -98,14 +349,9 @@ class Collider:
         return CollisionData(colliders=snapped)
 
     def is_colliding(self, dx, dy) -> bool:
-        for collider in Collider.all_colliders + Collider.temp_colliders:
-            if collider is self:
-                continue
-
-            if collider.rect.move(dx, dy).colliderect(self.rect):
-                return True
-
-        return False
+        area = self.rect.move(-dx, -dy)
+        nearby = self.get_nearby(area)
+        return any(i != self.index for i in Collider.store.overlapping(area, nearby))
 
     def draw(self, fill=False, color="red"):
         pygame.draw.rect(
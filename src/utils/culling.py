@@ -0,0 +1,41 @@
+import pygame
+
+from src import shared
+
+
+class Culler:
+    """Draws only the objects whose world rect overlaps the camera view plus
+    a margin, counting drawn and culled objects per name each frame.
+
+    Objects that draw outside their `rect` expose a covering `draw_rect`.
+    Ones with neither are always drawn.
+    """
+
+    def __init__(self, margin: int = shared.TILE_SIDE * 2) -> None:
+        self.margin = margin
+        self.view = pygame.Rect()
+        self.drawn: dict[str, int] = {}
+        self.culled: dict[str, int] = {}
+
+    def begin(self):
+        # The offset, unlike camera.rect, is bounded and interpolated
+        self.view = pygame.Rect(shared.camera.offset, shared.srect.size).inflate(
+            self.margin * 2, self.margin * 2
+        )
+        self.drawn.clear()
+        self.culled.clear()
+
+    def draw(self, objects: list, name: str):
+        view = self.view
+        drawn = 0
+        for obj in objects:
+            rect = getattr(obj, "draw_rect", None)
+            if rect is None:
+                rect = getattr(obj, "rect", None)
+
+            if rect is None or view.colliderect(rect):
+                obj.draw()
+                drawn += 1
+
+        self.drawn[name] = drawn
+        self.culled[name] = len(objects) - drawn
@@ -0,0 +1,108 @@
+import typing as t
+from array import array
+
+import pygame
+
+
+class ComponentStore:
+    """Struct-of-arrays entity state, one typed array per component and one
+    row per entity. Entities keep their row index as `row`"""
+
+    def __init__(self, **components: str) -> None:
+        self.columns = {name: array(code) for name, code in components.items()}
+        self.owners: list = []
+        self.free: list[int] = []
+
+    def __getitem__(self, name: str) -> array:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.owners) - len(self.free)
+
+    def add(self, owner) -> int:
+        if self.free:
+            row = self.free.pop()
+        else:
+            row = len(self.owners)
+            for column in self.columns.values():
+                column.append(0)
+            self.owners.append(None)
+
+        self.owners[row] = owner
+        return row
+
+    def release(self, row: int):
+        for column in self.columns.values():
+            column[row] = 0
+        self.owners[row] = None
+        self.free.append(row)
+
+    def clear(self):
+        for column in self.columns.values():
+            del column[:]
+        self.owners.clear()
+        self.free.clear()
+
+    def rows(self) -> t.Iterator[int]:
+        for row, owner in enumerate(self.owners):
+            if owner is not None:
+                yield row
+
+    def column(self, name: str) -> "Column":
+        return Column(self[name])
+
+    def vector(self, x: str, y: str) -> "VectorColumns":
+        return VectorColumns(self[x], self[y])
+
+    def flag(self, name: str, bit: int) -> "FlagColumn":
+        return FlagColumn(self[name], bit)
+
+
+class Column:
+    """Class attribute exposing one component of the owner's row"""
+
+    def __init__(self, column: array) -> None:
+        self.column = column
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self.column[obj.row]
+
+    def __set__(self, obj, value):
+        self.column[obj.row] = value
+
+
+class VectorColumns:
+    """Class attribute exposing two components as a Vector2 copy"""
+
+    def __init__(self, x: array, y: array) -> None:
+        self.x = x
+        self.y = y
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return pygame.Vector2(self.x[obj.row], self.y[obj.row])
+
+    def __set__(self, obj, value):
+        self.x[obj.row], self.y[obj.row] = value
+
+
+class FlagColumn:
+    """Class attribute exposing one bit of an integer component"""
+
+    def __init__(self, column: array, bit: int) -> None:
+        self.column = column
+        self.bit = bit
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return bool(self.column[obj.row] & self.bit)
+
+    def __set__(self, obj, value: bool):
+        if value:
+            self.column[obj.row] |= self.bit
+        else:
+            self.column[obj.row] &= ~self.bit
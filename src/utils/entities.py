@@ -5,6 +5,8 @@ import pytmx
 
 from src import shared
 
+from .grid import TileGrid
+
 
 class Entity(t.Protocol):
     objects: list
@@ -47,3 +49,20 @@ def make_entities_from_tmx(tmx_file_path, type_factory: list[t.Type[Entity]]):
                 entity_type(
                     (x * tiled_map.tilewidth, y * tiled_map.tileheight), map_image
                 )
+
+
+def make_tile_grid_from_tmx(tiled_map: pytmx.TiledMap, solid_type: str = "Tile"):
+    grid = TileGrid(tiled_map.width, tiled_map.height, tiled_map.tilewidth)
+    for layer in tiled_map.layers:
+        if not isinstance(layer, pytmx.TiledTileLayer):
+            continue
+
+        for x, y, gid in layer.iter_data():
+            if not gid:
+                continue
+
+            properties = tiled_map.get_tile_properties_by_gid(gid)
+            if properties is not None and properties.get("type") == solid_type:
+                grid.set_solid(x, y)
+
+    return grid
@@ -0,0 +1,153 @@
+import pygame
+
+from .collision import sweep_time
+
+
+def intersect_ranges(a: range, b: range) -> range:
+    start = max(a.start, b.start)
+    return range(start, max(start, min(a.stop, b.stop)))
+
+
+class TileGrid:
+    """Occupancy bitmap of solid tiles, indexed by column and row"""
+
+    def __init__(self, width: int, height: int, tile_side: int) -> None:
+        self.width = width
+        self.height = height
+        self.tile_side = tile_side
+        self.cells = bytearray(width * height)
+
+    def set_solid(self, col: int, row: int, solid: bool = True):
+        self.cells[row * self.width + col] = solid
+
+    def is_solid(self, col: int, row: int) -> bool:
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return bool(self.cells[row * self.width + col])
+        return False
+
+    def cell_at(self, pos) -> tuple[int, int]:
+        return int(pos[0] // self.tile_side), int(pos[1] // self.tile_side)
+
+    def cell_span(self, rect: pygame.Rect | pygame.FRect) -> tuple[range, range]:
+        """Columns and rows of the cells `rect` overlaps, clamped to the map"""
+
+        if rect.width <= 0 or rect.height <= 0:
+            return range(0), range(0)
+
+        side = self.tile_side
+        left = max(0, int(rect.left // side))
+        top = max(0, int(rect.top // side))
+        right = min(self.width, -int(-rect.right // side))
+        bottom = min(self.height, -int(-rect.bottom // side))
+
+        return range(left, max(left, right)), range(top, max(top, bottom))
+
+    def any_solid(
+        self,
+        rect: pygame.Rect | pygame.FRect,
+        bounds: pygame.Rect | pygame.FRect | None = None,
+    ) -> bool:
+        """Whether `rect` overlaps a solid cell, only counting cells that
+        also overlap `bounds` if given"""
+
+        cols, rows = self.cell_span(rect)
+        if bounds is not None:
+            bound_cols, bound_rows = self.cell_span(bounds)
+            cols = intersect_ranges(cols, bound_cols)
+            rows = intersect_ranges(rows, bound_rows)
+
+        cells = self.cells
+        for row in rows:
+            start = row * self.width
+            if any(cells[start + cols.start : start + cols.stop]):
+                return True
+        return False
+
+    def first_solid_x(self, rect: pygame.Rect | pygame.FRect, dx: float) -> int | None:
+        """Column of the first solid cell hit when moving `rect` by `dx`"""
+
+        if dx == 0:
+            return None
+
+        cols, rows = self.cell_span(rect.union(rect.move(dx, 0)))
+        for col in cols if dx > 0 else reversed(cols):
+            for row in rows:
+                if self.cells[row * self.width + col]:
+                    return col
+        return None
+
+    def first_solid_y(self, rect: pygame.Rect | pygame.FRect, dy: float) -> int | None:
+        """Row of the first solid cell hit when moving `rect` by `dy`"""
+
+        if dy == 0:
+            return None
+
+        cols, rows = self.cell_span(rect.union(rect.move(0, dy)))
+        for row in rows if dy > 0 else reversed(rows):
+            start = row * self.width
+            if any(self.cells[start + cols.start : start + cols.stop]):
+                return row
+        return None
+
+    def sweep(
+        self, rect: pygame.Rect | pygame.FRect, dx: float, dy: float
+    ) -> float | None:
+        """Earliest time of impact of `rect` moving by (dx, dy) into a solid cell"""
+
+        side = self.tile_side
+        cell = pygame.Rect(0, 0, side, side)
+        cols, rows = self.cell_span(rect.union(rect.move(dx, dy)))
+        earliest = None
+
+        for row in rows:
+            start = row * self.width
+            for col in cols:
+                if not self.cells[start + col]:
+                    continue
+
+                cell.topleft = col * side, row * side
+                toi = sweep_time(rect, dx, dy, cell)
+                if toi is not None and (earliest is None or toi < earliest):
+                    earliest = toi
+
+        return earliest
+
+    def merged_rects(self) -> list[tuple[int, int, int, int]]:
+        """Greedily covers the solid cells with maximal non-overlapping
+        rectangles, returned as (col, row, width, height) in cells"""
+
+        width = self.width
+        cells = self.cells
+        covered = bytearray(len(cells))
+        rects = []
+
+        for row in range(self.height):
+            for col in range(width):
+                index = row * width + col
+                if not cells[index] or covered[index]:
+                    continue
+
+                run = 1
+                while (
+                    col + run < width
+                    and cells[index + run]
+                    and not covered[index + run]
+                ):
+                    run += 1
+
+                n_rows = 1
+                while row + n_rows < self.height:
+                    start = (row + n_rows) * width + col
+                    if not all(cells[start : start + run]) or any(
+                        covered[start : start + run]
+                    ):
+                        break
+                    n_rows += 1
+
+                for covered_row in range(row, row + n_rows):
+                    start = covered_row * width + col
+                    covered[start : start + run] = b"\x01" * run
+
+                rects.append((col, row, run, n_rows))
+
+        return rects
@@ -0,0 +1,15 @@
+class KeySet:
+    """Indexable by key code like pygame.key.get_pressed(), backed by a set so
+    it can be built up from events and recorded"""
+
+    def __init__(self, keys=()) -> None:
+        self.keys: set[int] = set(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+    def add(self, key: int):
+        self.keys.add(key)
+
+    def discard(self, key: int):
+        self.keys.discard(key)
@@ -1,7 +1,7 @@
 import functools
 import math
+import random
 import sys
-import time
 import typing as t
 from pathlib import Path
 
@@ -9,13 +9,34 @@ import pygame
 
 from src import shared
 
+from .clock import now
 
-def updater(entities):
-    for entity in entities[:]:
-        entity.update()
+# Gameplay randomness, seeded by input recordings so replays match
+rng = random.Random()
 
-        if not entity.alive:
-            entities.remove(entity)
+
+def updater(entities, pool=None):
+    """Updates `entities`, then drops the dead ones in one in-place pass.
+    Entities added during the update wait until the next call"""
+
+    for i in range(len(entities)):
+        entities[i].update()
+
+    kept = 0
+    for entity in entities:
+        if entity.alive:
+            entities[kept] = entity
+            kept += 1
+        elif pool is not None:
+            pool.release(entity)
+    del entities[kept:]
+
+
+class EntityList(list):
+    """List of entities with an `alive` flag, updated by `updater`"""
+
+    def update(self, pool=None):
+        updater(self, pool)
 
 
 def drawer(entities):
@@ -127,17 +148,20 @@ class Timer:
 
     def __init__(self, time_to_pass: float):
         self.time_to_pass = time_to_pass
-        self.start = time.perf_counter()
+        self.start = now()
 
     def reset(self):
-        self.start = time.perf_counter()
+        self.start = now()
 
     def tick(self) -> bool:
-        if time.perf_counter() - self.start > self.time_to_pass:
-            self.start = time.perf_counter()
+        if now() - self.start > self.time_to_pass:
+            self.start = now()
             return True
         return False
 
+    def shift(self, seconds: float):
+        self.start += seconds
+
 
 class CooldownTimer:
     """
@@ -153,13 +177,17 @@ class CooldownTimer:
     def start(self):
         self.is_cooling_down = True
         self.amount_cooled = 0.0
-        self.start_time = time.perf_counter()
+        self.start_time = now()
+
+    def shift(self, seconds: float):
+        if self.start_time is not None:
+            self.start_time += seconds
 
     def update(self):
         if not self.is_cooling_down:
             return
 
-        time_passed = time.perf_counter() - self.start_time  # type: ignore
+        time_passed = now() - self.start_time  # type: ignore
         self.amount_cooled = time_passed / self.seconds
 
         if time_passed >= self.seconds:
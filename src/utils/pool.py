@@ -0,0 +1,40 @@
+class Pool:
+    """Recycles dead instances of the class it is declared on.
+
+    Pooled classes take the same arguments in `reset` as in `__init__`, and
+    `reset` must leave the object as good as freshly constructed.
+    """
+
+    pools: list["Pool"] = []
+
+    def __init__(self) -> None:
+        self.free: list = []
+        self.hits = 0
+        self.misses = 0
+        Pool.pools.append(self)
+
+    def __set_name__(self, owner, name):
+        self.cls = owner
+
+    def acquire(self, *args):
+        if not self.free:
+            self.misses += 1
+            return self.cls(*args)
+
+        self.hits += 1
+        obj = self.free.pop()
+        obj.reset(*args)
+        return obj
+
+    def release(self, obj):
+        self.free.append(obj)
+
+    def stats(self) -> str:
+        return (
+            f"{self.cls.__name__}: {self.hits} hits, {self.misses} misses,"
+            f" {len(self.free)} free"
+        )
+
+    @classmethod
+    def report(cls) -> list[str]:
+        return [pool.stats() for pool in cls.pools]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+import typing as t
+from dataclasses import dataclass
+
+import pygame
+
+from .collision import sweep_time
+from .grid import TileGrid
+
+
+@dataclass
+class RayHit:
+    point: pygame.Vector2
+    distance: float
+    cell: tuple[int, int] | None = None
+    target: t.Any = None
+
+
+def segment_time(start, end, rect: pygame.Rect | pygame.FRect) -> float | None:
+    """Fraction of the segment from `start` to `end` at which it enters `rect`"""
+
+    return sweep_time(
+        pygame.FRect(start, (0, 0)), end[0] - start[0], end[1] - start[1], rect
+    )
+
+
+def cast_grid(grid: TileGrid, start, end) -> tuple[tuple[int, int], float] | None:
+    """First solid cell the segment crosses and the fraction it is entered at,
+    stepping cell by cell along the segment (Amanatides & Woo)"""
+
+    x, y = start
+    dx, dy = end[0] - x, end[1] - y
+    side = grid.tile_side
+    col, row = grid.cell_at(start)
+    if grid.is_solid(col, row):
+        return (col, row), 0.0
+
+    step_col = 1 if dx > 0 else -1
+    step_row = 1 if dy > 0 else -1
+    if dx:
+        t_max_x = ((col + (dx > 0)) * side - x) / dx
+        t_delta_x = side / abs(dx)
+    else:
+        t_max_x = t_delta_x = math.inf
+    if dy:
+        t_max_y = ((row + (dy > 0)) * side - y) / dy
+        t_delta_y = side / abs(dy)
+    else:
+        t_max_y = t_delta_y = math.inf
+
+    while True:
+        if t_max_x < t_max_y:
+            col += step_col
+            toi = t_max_x
+            t_max_x += t_delta_x
+        else:
+            row += step_row
+            toi = t_max_y
+            t_max_y += t_delta_y
+
+        if toi > 1:
+            return None
+        if grid.is_solid(col, row):
+            return (col, row), toi
+
+
+def raycast(grid: TileGrid, start, end, targets: t.Iterable = ()) -> RayHit | None:
+    """First thing hit travelling from `start` to `end`: a solid cell of
+    `grid` or, if given, the `rect` of one of `targets` in front of it"""
+
+    start = pygame.Vector2(start)
+    delta = pygame.Vector2(end) - start
+    length = delta.length()
+
+    hit = None
+    limit = 1.0
+    wall = cast_grid(grid, start, end)
+    if wall is not None:
+        cell, limit = wall
+        hit = RayHit(start + delta * limit, length * limit, cell=cell)
+
+    for target in targets:
+        toi = segment_time(start, end, target.rect)
+        if toi is not None and toi < limit:
+            limit = toi
+            hit = RayHit(start + delta * toi, length * toi, target=target)
+
+    return hit
+
+
+def has_line_of_sight(grid: TileGrid, start, end) -> bool:
+    return cast_grid(grid, start, end) is None
@@ -0,0 +1,69 @@
+import typing as t
+import weakref
+
+import pygame
+
+
+class SpriteCache:
+    """Copies of images made by `transform`, with its parameter snapped to
+    `step` and each variant made the first time it is asked for.
+
+    Variants are shared between callers, so they must not be changed; set
+    per-object state like alpha right before blitting instead. Entries go
+    away with the image they were made from.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        step: float,
+        transform: t.Callable[[pygame.Surface, float], pygame.Surface],
+    ) -> None:
+        self.name = name
+        self.step = step
+        self.transform = transform
+        self.variants: weakref.WeakKeyDictionary[
+            pygame.Surface, dict[int, pygame.Surface]
+        ] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def variant(self, image: pygame.Surface, index: int) -> pygame.Surface:
+        variants = self.variants.get(image)
+        if variants is None:
+            variants = self.variants[image] = {}
+
+        surf = variants.get(index)
+        if surf is None:
+            self.misses += 1
+            surf = variants[index] = self.transform(image, index * self.step)
+        else:
+            self.hits += 1
+        return surf
+
+    def stats(self) -> str:
+        n_variants = sum(len(variants) for variants in self.variants.values())
+        return (
+            f"{self.name}: {self.hits} hits, {self.misses} misses, {n_variants} cached"
+        )
+
+
+class RotationCache(SpriteCache):
+    def __init__(self, step: float = 2.0) -> None:
+        super().__init__("Rotations", step, pygame.transform.rotate)
+        self.n_steps = round(360 / step)
+
+    def rotate(self, image: pygame.Surface, angle: float) -> pygame.Surface:
+        return self.variant(image, round(angle / self.step) % self.n_steps)
+
+
+class ScaleCache(SpriteCache):
+    def __init__(self, step: float = 0.01) -> None:
+        super().__init__("Scales", step, pygame.transform.scale_by)
+
+    def scale_by(self, image: pygame.Surface, factor: float) -> pygame.Surface:
+        return self.variant(image, round(factor / self.step))
+
+
+rotations = RotationCache()
+scales = ScaleCache()
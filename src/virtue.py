@@ -1,50 +1,59 @@
 from __future__ import annotations
 
-import itertools
-import time
 import typing as t
 
 import pygame
 
-from src import shared, utils
+from src import enemies, shared, utils
 from src.blood_splatter import BloodSplatter
-from src.ui import CoinLineEffect, Flash
 
 if t.TYPE_CHECKING:
     from src.spawner import EntitySpawner
 
 
+def make_wing(color: str) -> pygame.Surface:
+    wing = pygame.Surface((28, 5), pygame.SRCALPHA)
+    wing.fill(color)
+    return wing
+
+
 class Virtue:
     objects: list[t.Self] = []
     spawner: EntitySpawner
 
+    pos = enemies.store.vector("x", "y")
+    prev_pos = enemies.store.vector("prev_x", "prev_y")
+    health = enemies.store.column("health")
+    spawned = enemies.store.flag("flags", enemies.SPAWNED)
+    near = enemies.store.flag("flags", enemies.NEAR)
+    chase_speed = enemies.store.column("speed")
+
     SPEED = 3
     WING_ROTATE_SPEED = 10
     ATTACK_FOLLOW_SPEED = 50
     ATTACK_TIME = 6.0
+    # Shared by every virtue so their rotations are cached once
+    WING_1 = make_wing(shared.PALETTE["purple"])
+    WING_2 = make_wing(shared.PALETTE["red2"])
 
     def __init__(self, pos, image: pygame.Surface) -> None:
         Virtue.objects.append(self)
+        self.row = enemies.store.add(self)
         self.pos = pygame.Vector2(pos)
+        self.prev_pos = self.pos
+        self.chase_speed = Virtue.SPEED
         self.original_image = image
         self.image = image
         self.rect = self.image.get_rect(topleft=self.pos)
 
-        self.spawn_start_time: float | None = None
-        self.spawn_animation_timer = utils.Timer(0.2)
-
         self.white_image = image.copy()
         self.white_image.fill("purple", special_flags=pygame.BLEND_RGBA_ADD)
 
-        self.spawn_images = itertools.cycle([self.white_image, image])
-
-        self.wing_original = pygame.Surface((28, 5), pygame.SRCALPHA)
-        self.wing_original.fill(shared.PALETTE["purple"])
-        self.wing_1 = pygame.transform.rotate(self.wing_original, 45)
+        self.wing_1 = utils.rotations.rotate(Virtue.WING_1, 45)
         self.wing_1_rect = self.wing_1.get_rect(center=self.rect.center)
         self.angle_1 = 45
 
-        self.wing_2 = pygame.transform.rotate(self.wing_original, -45)
+        self.wing_2 = utils.rotations.rotate(Virtue.WING_1, -45)
         self.wing_2_rect = self.wing_2.get_rect(center=self.rect.center)
         self.angle_2 = -45
 
@@ -62,34 +71,28 @@ class Virtue:
         self.god_strike.set_alpha(0)
         self.strike_rect = self.god_strike.get_rect(center=self.god_rect.center)
         self.god_alpha = 0
-        self.god_start = time.perf_counter()
+        self.god_start = utils.now()
         self.damage_first = True
 
         self.first = True
 
-    def move(self):
-        self.pos.move_towards_ip(shared.player.collider.pos, Virtue.SPEED * shared.dt)
-        self.rect.topleft = self.pos
-
     def update_wings(self):
         self.angle_1 += Virtue.WING_ROTATE_SPEED * shared.dt
         self.angle_1 %= 360
-        self.wing_1 = pygame.transform.rotate(self.wing_original, self.angle_1)
+        self.wing_1 = utils.rotations.rotate(Virtue.WING_1, self.angle_1)
         self.wing_1_rect = self.wing_1.get_rect(center=self.rect.center)
 
         self.angle_2 -= Virtue.WING_ROTATE_SPEED * shared.dt
         self.angle_2 %= 360
-        temp = self.wing_original.copy()
-        temp.fill(shared.PALETTE["red2"])
-        self.wing_2 = pygame.transform.rotate(temp, self.angle_2)
+        self.wing_2 = utils.rotations.rotate(Virtue.WING_2, self.angle_2)
         self.wing_2_rect = self.wing_2.get_rect(center=self.rect.center)
 
     def call_heavenly_strike(self):
         if self.first:
-            self.god_start = time.perf_counter()
+            self.god_start = utils.now()
             self.first = False
 
-        god_diff = time.perf_counter() - self.god_start
+        god_diff = utils.now() - self.god_start
 
         if god_diff < Virtue.ATTACK_TIME:
             self.god_alpha = 200 * (god_diff / Virtue.ATTACK_TIME)
@@ -120,64 +123,46 @@ class Virtue:
         if self.strike_rect.colliderect(shared.player.collider.rect):
             shared.player.health -= 500
 
-    def on_bullet_collide(self, bullet):
-        self.health -= bullet.damage
-        bullet.alive = False
-
-        if bullet.coin_history:
-            points = [shared.player.collider.pos] + bullet.coin_history + [self.pos]
-            shared.fx_manager.coin_lines.append(CoinLineEffect(points))
-            shared.fx_manager.flashes.append(Flash())
-
-    def handle_damage(self):
-        for bullet in shared.shotgun_bullets + shared.pistol_bullets:
-            if self.rect.colliderect(bullet.collider_rect):
-                self.on_bullet_collide(bullet)
-
-        for blade in shared.sawblades:
-            if blade.rect.colliderect(self.rect):
-                self.health -= blade.damage
-
-        for fireball in shared.fireballs:
-            if not fireball.boosted:
-                continue
-
-            if fireball.rect.colliderect(self.rect):
-                self.health -= fireball.DAMAGE
-                fireball.alive = False
+    def check_health(self):
         if self.health <= 0:
             try:
                 Virtue.objects.remove(self)
-                shared.blood_splatters.append(BloodSplatter(self.rect.center, 100))
+                enemies.store.release(self.row)
+                enemies.registry.remove(self)
+                shared.active_region.forget(self)
+                shared.blood_splatters.append(
+                    BloodSplatter.pool.acquire(self.rect.center, 100)
+                )
 
             except ValueError:
                 pass
 
-    def update(self):
-        if not self.spawner.activated:
-            return
-        elif self.spawn_start_time is None:
-            self.spawn_start_time = time.perf_counter()
+    def resume(self, slept: float):
+        self.god_start += slept
 
-        if time.perf_counter() - self.spawn_start_time < 0.7:
-            if self.spawn_animation_timer.tick():
-                self.image = next(self.spawn_images)
+    def update(self):
+        if not self.spawned:
             return
-        else:
-            self.image = self.original_image
 
-        self.move()
+        self.rect.topleft = self.pos
         self.update_wings()
-        self.handle_damage()
         self.call_heavenly_strike()
 
-    def draw(self):
-        if not self.spawner.activated:
-            return
-
-        shared.screen.blit(self.wing_1, shared.camera.transform(self.wing_1_rect))
-        shared.screen.blit(self.wing_2, shared.camera.transform(self.wing_2_rect))
-        shared.screen.blit(self.image, shared.camera.transform(self.pos))
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        return self.rect.unionall(
+            [self.wing_1_rect, self.wing_2_rect, self.god_rect, self.strike_rect]
+        )
 
-        shared.screen.blit(self.god, shared.camera.transform(self.god_rect))
-        shared.screen.blit(self.god_strike, shared.camera.transform(self.strike_rect))
+    def draw(self):
+        with shared.camera.between_steps(self.prev_pos, self.pos):
+            shared.screen.blit(self.wing_1, shared.camera.transform(self.wing_1_rect))
+            shared.screen.blit(self.wing_2, shared.camera.transform(self.wing_2_rect))
+            shared.screen.blit(self.image, shared.camera.transform(self.pos))
+
+        # The strike follows the player, not the virtue
+        with shared.player.between_steps():
+            shared.screen.blit(self.god, shared.camera.transform(self.god_rect))
+            shared.screen.blit(
+                self.god_strike, shared.camera.transform(self.strike_rect)
+            )
@@ -1,15 +1,20 @@
-import pygame
-
-from src import shared, utils
+from src import enemies, shared, utils
+from src.active_region import ActiveRegion
+from src.blood_splatter import BloodSplatter
 from src.checkpoint import Checkpoint
+from src.damage import DamageSystem
 from src.decorations import Decoration, FGDecoration, Note
 from src.door import HellPit
 from src.filth import Filth, FilthyArea
+from src.fireball import FireBall
 from src.gabriel import Gabriel
 from src.guns import GunState, Pistol, SawbladeLauncher, Shotgun
+from src.hell_gradient import HellGradient
 from src.hitting_target import HittingTarget
 from src.maurice import Maurice
 from src.player import Player
+from src.profiler import profiler
+from src.projectiles import Bullet, Coin, CoreEject, Explosion, Sawblade
 from src.soldier import Soldier
 from src.spatial import GravityWell, Portal
 from src.spawner import EntitySpawner
@@ -33,27 +38,56 @@ ENTITIES: list[utils.EntityType] = [
     Gabriel,
     Checkpoint,
 ]
+REGION_BOUND: list[utils.EntityType] = [Filth, Maurice, Soldier, Virtue]
+# Shared projectile lists, by attribute name on `shared`, and their pools
+PROJECTILES: dict[str, utils.Pool | None] = {
+    "pistol_bullets": Bullet.pool,
+    "shotgun_bullets": Bullet.pool,
+    "coins": Coin.pool,
+    "fireballs": FireBall.pool,
+    "cores": CoreEject.pool,
+    "explosions": Explosion.pool,
+    "blood_splatters": BloodSplatter.pool,
+    "sawblades": Sawblade.pool,
+    "magnets": None,
+}
+# Projectiles that move, and so are drawn between their last two steps
+MOVING_PROJECTILES = [
+    "pistol_bullets",
+    "shotgun_bullets",
+    "coins",
+    "cores",
+    "fireballs",
+    "sawblades",
+    "magnets",
+]
 
 
 class World:
-    GRADIAL_LAYERS = 20
-
     def __init__(self):
-        shared.pistol_bullets = []
-        shared.shotgun_bullets = []
-        shared.coins = []
-        shared.fireballs = []
-        shared.cores = []
-        shared.explosions = []
-        shared.blood_splatters = []
-        shared.sawblades = []
-        shared.magnets = []
+        shared.pistol_bullets = utils.EntityList()
+        shared.shotgun_bullets = utils.EntityList()
+        shared.coins = utils.EntityList()
+        shared.fireballs = utils.EntityList()
+        shared.cores = utils.EntityList()
+        shared.explosions = utils.EntityList()
+        shared.blood_splatters = utils.EntityList()
+        shared.sawblades = utils.EntityList()
+        shared.magnets = utils.EntityList()
         utils.make_entities_from_tmx(
-            f"assets/map_{shared.level_no}.tmx", type_factory=ENTITIES
+            shared.map_path or f"assets/map_{shared.level_no}.tmx",
+            type_factory=ENTITIES,
         )
         if shared.level_no == shared.BOSS_LEVEL:
             Gabriel.objects[0].rng_attack()
 
+        self.spawn_system = enemies.SpawnSystem()
+        self.chase_system = enemies.ChaseSystem()
+        self.damage_system = DamageSystem()
+        shared.active_region = self.active_region = ActiveRegion()
+        self.culler = utils.Culler()
+        self.make_tile_grid()
+        self.merge_tile_colliders()
         self.get_filthy_areas()
         self.get_save_weapons()
         self.make_note_objects()
@@ -61,13 +95,31 @@ class World:
         self.make_spawners()
         self.make_gravity_wells()
         self.create_hell_gradient()
+        self.bake_static_layer()
         self.load_checkpoint()
 
     def load_checkpoint(self):
         if shared.last_checkpoint is None:
             return
 
-        shared.player.collider.pos = shared.last_checkpoint.pos
+        shared.player.teleport(shared.last_checkpoint.pos)
+
+    def bake_static_layer(self):
+        self.static_layer = utils.ChunkedLayer()
+        for entity in (Tile, Decoration):
+            for obj in entity.objects:
+                self.static_layer.add(obj.image, obj.pos)
+        self.static_layer.bake()
+
+    def make_tile_grid(self):
+        shared.tile_grid = utils.make_tile_grid_from_tmx(shared.tmx_map)
+
+    def merge_tile_colliders(self):
+        for col, row, width, height in shared.tile_grid.merged_rects():
+            utils.Collider(
+                (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
+                (width * shared.TILE_SIDE, height * shared.TILE_SIDE),
+            )
 
     def get_filthy_areas(self):
         try:
@@ -78,10 +130,6 @@ class World:
         for obj in filthy_layer:  # type: ignore
             area = FilthyArea((obj.x, obj.y), obj.width, obj.height)
 
-            for tile in Tile.objects:
-                if tile.rect.colliderect(area.rect):
-                    area.tiles.append(tile)
-
             for filth in Filth.objects:
                 if filth.rect.colliderect(area.rect):
                     filth.filthy_area = area
@@ -153,6 +201,11 @@ class World:
                     if spawner.rect.colliderect(obj.rect):
                         obj.spawner = spawner
 
+        for entity_type in (Filth, Virtue, Soldier, Maurice):
+            for obj in entity_type.objects:
+                obj.spawner.sleeping.append(obj)
+            entity_type.objects.clear()
+
     def make_gravity_wells(self):
         try:
             wells_layer = shared.tmx_map.get_layer_by_name("GravityWells")
@@ -165,142 +218,73 @@ class World:
     def create_hell_gradient(self):
         if shared.level_no == shared.BOSS_LEVEL:
             return
-        n_layers = World.GRADIAL_LAYERS
-        self.hell_gradient = pygame.Surface(
-            (
-                (shared.tmx_map.width + (n_layers * 2)) * shared.TILE_SIDE,
-                (shared.tmx_map.height + (n_layers * 2)) * shared.TILE_SIDE,
-            ),
-            pygame.SRCALPHA,
-        )
-        gradial_tile_images = [
-            utils.darken_image(
-                shared.ENTITY_CLASS_IMAGES["Tile"].copy(), 255 * (i / n_layers)
-            )
-            for i in range(n_layers)
-        ]
-
-        def hawk_tuah(pos, image):
-            self.hell_gradient.blit(
-                image,
-                pygame.Vector2(pos)
-                + (
-                    n_layers * shared.TILE_SIDE,
-                    n_layers * shared.TILE_SIDE,
-                ),
-            )
-
-        # Left
-        for row in range(shared.tmx_map.height):
-            for col in range(0, -n_layers, -1):
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[abs(col)],
-                )
-
-        # Up
-        for col in range(shared.tmx_map.width):
-            for row in range(0, -n_layers, -1):
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[abs(row)],
-                )
-
-        # Right
-        for row in range(shared.tmx_map.height):
-            for col in range(shared.tmx_map.width, shared.tmx_map.width + n_layers):
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[abs(col - shared.tmx_map.width)],
-                )
-
-        # Down
-        for col in range(shared.tmx_map.width):
-            for row in range(shared.tmx_map.height, shared.tmx_map.height + n_layers):
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[abs(row - shared.tmx_map.height)],
-                )
-
-        # Top-left corner
-        for row in range(0, -n_layers, -1):
-            for col in range(0, -n_layers, -1):
-                d = max(abs(row), abs(col))
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[d],
-                )
-
-        # Top-right corner
-        for row in range(0, -n_layers, -1):
-            for col in range(shared.tmx_map.width, shared.tmx_map.width + n_layers):
-                d = max(abs(row), abs(col - shared.tmx_map.width))
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[d],
-                )
-
-        # Bottom-left corner
-        for row in range(shared.tmx_map.height, shared.tmx_map.height + n_layers):
-            for col in range(0, -n_layers, -1):
-                d = max(abs(row - shared.tmx_map.height), abs(col))
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[d],
-                )
-
-        # Bottom-right corner
-        for row in range(shared.tmx_map.height, shared.tmx_map.height + n_layers):
-            for col in range(shared.tmx_map.width, shared.tmx_map.width + n_layers):
-                d = max(
-                    abs(row - shared.tmx_map.height), abs(col - shared.tmx_map.width)
-                )
-                hawk_tuah(
-                    (col * shared.TILE_SIDE, row * shared.TILE_SIDE),
-                    gradial_tile_images[d],
-                )
+        self.hell_gradient = HellGradient()
 
     def clear_world(self):
-        utils.Collider.all_colliders.clear()
+        utils.Collider.clear_all()
+        enemies.store.clear()
+        enemies.registry.clear()
+        self.active_region.clear()
         for entity in ENTITIES + [Note, EntitySpawner, GravityWell, Portal]:
             entity.objects.clear()
 
+    def begin_step(self):
+        enemies.begin_step()
+        for gabriel in Gabriel.objects:
+            gabriel.begin_step()
+        for name in MOVING_PROJECTILES:
+            for projectile in getattr(shared, name):
+                projectile.prev_pos.update(projectile.pos)
+
     def update(self):
         if not shared.is_world_frozen:
-            shared.player.update()
+            with profiler.section("update:Player"):
+                shared.player.update()
+            with profiler.section("update:systems"):
+                self.spawn_system.update()
+                self.chase_system.update()
+                self.active_region.update()
             for entity in ENTITIES + [EntitySpawner, GravityWell, Portal]:
-                for obj in entity.objects:
-                    obj.update()
-
-            utils.updater(shared.pistol_bullets)
-            utils.updater(shared.shotgun_bullets)
-            utils.updater(shared.coins)
-            utils.updater(shared.fireballs)
-            utils.updater(shared.cores)
-            utils.updater(shared.explosions)
-            utils.updater(shared.blood_splatters)
-            utils.updater(shared.sawblades)
-            utils.updater(shared.magnets)
+                with profiler.section(f"update:{entity.__name__}"):
+                    if entity in REGION_BOUND:
+                        for obj in entity.objects:
+                            self.active_region.tick(obj)
+                        continue
+
+                    for obj in entity.objects:
+                        obj.update()
+
+            with profiler.section("update:damage"):
+                enemies.registry.reindex()
+                self.damage_system.update()
+            for name, pool in PROJECTILES.items():
+                with profiler.section(f"updater:{name}"):
+                    utils.updater(getattr(shared, name), pool)
+
+        if profiler.enabled:
+            for entity in ENTITIES:
+                profiler.count(entity.__name__, len(entity.objects))
+            for name in PROJECTILES:
+                profiler.count(name, len(getattr(shared, name)))
 
         if shared.next_state is not None:
             self.clear_world()
 
     def render_entities(self, entities: list[utils.EntityType]):
         for entity in entities:
-            for obj in entity.objects:
-                obj.draw()
+            with profiler.section(f"draw:{entity.__name__}"):
+                self.culler.draw(entity.objects, entity.__name__)
 
     def draw(self):
+        self.culler.begin()
         if shared.level_no != shared.BOSS_LEVEL:
-            shared.screen.blit(
-                self.hell_gradient,
-                shared.camera.transform(
-                    pygame.Vector2(-World.GRADIAL_LAYERS, -World.GRADIAL_LAYERS)
-                    * shared.TILE_SIDE
-                ),
-            )
-        self.render_entities([Tile, Decoration, HittingTarget, HellPit, Checkpoint])
-        shared.player.draw()
+            with profiler.section("draw:hell_gradient"):
+                self.hell_gradient.draw()
+        with profiler.section("draw:static_layer"):
+            self.static_layer.draw()
+        self.render_entities([HittingTarget, HellPit, Checkpoint])
+        with profiler.section("draw:Player"):
+            shared.player.draw()
         self.render_entities(
             [
                 Pistol,
@@ -316,19 +300,14 @@ class World:
             ]
         )
 
-        utils.drawer(shared.pistol_bullets)
-        utils.drawer(shared.shotgun_bullets)
-        utils.drawer(shared.coins)
-        utils.drawer(shared.fireballs)
-        utils.drawer(shared.cores)
-        utils.drawer(shared.explosions)
-        utils.drawer(shared.blood_splatters)
-        utils.drawer(shared.sawblades)
-        utils.drawer(shared.magnets)
+        for name in PROJECTILES:
+            with profiler.section(f"draw:{name}"):
+                self.culler.draw(getattr(shared, name), name)
 
         shared.player.draw_fist()
-        for obj in Portal.objects:
-            obj.draw()
+        self.render_entities([Portal, GravityWell])
 
-        for obj in GravityWell.objects:
-            obj.draw()
+        if profiler.enabled:
+            for name, n in self.culler.drawn.items():
+                profiler.count(f"drawn:{name}", n)
+                profiler.count(f"culled:{name}", self.culler.culled[name])
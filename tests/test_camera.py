@@ -0,0 +1,37 @@
+import unittest
+
+import pygame
+
+from src import shared, utils
+
+
+class BetweenStepsTest(unittest.TestCase):
+    def setUp(self):
+        shared.srect = pygame.Rect(0, 0, 600, 300)
+        shared.frame_alpha = 0.25
+        self.camera = utils.Camera()
+        self.camera.offset.update(10, 5)
+
+    def test_draws_between_last_two_steps(self):
+        with self.camera.between_steps((0, 0), (8, 4)):
+            drawn = self.camera.transform((8, 4))
+
+        # A quarter of the way from (0, 0) to (8, 4), minus the offset
+        self.assertEqual(drawn, pygame.Vector2(2 - 10, 1 - 5))
+
+    def test_restores_offset(self):
+        with self.camera.between_steps((0.1, 0.7), (3.3, 9.9)):
+            pass
+
+        self.assertEqual(self.camera.offset, pygame.Vector2(10, 5))
+
+    def test_draws_at_latest_step_when_alpha_is_one(self):
+        shared.frame_alpha = 1.0
+        with self.camera.between_steps((0, 0), (8, 4)):
+            drawn = self.camera.transform((8, 4))
+
+        self.assertEqual(drawn, pygame.Vector2(8 - 10, 4 - 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
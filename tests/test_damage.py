@@ -0,0 +1,64 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src import enemies, shared
+from src.damage import DamageSystem
+from src.projectiles import Sawblade
+
+
+class Target:
+    pos = enemies.store.vector("x", "y")
+
+    def __init__(self, pos) -> None:
+        self.row = enemies.store.add(self)
+        self.pos = pos
+        self.rect = pygame.Rect(pos, (16, 16))
+        self.spawned = True
+        self.health = 1000.0
+
+
+class SawbladeDamageTest(unittest.TestCase):
+    def setUp(self):
+        pygame.display.set_mode((1, 1))
+        enemies.store.clear()
+        enemies.registry.clear()
+        shared.sawblades = []
+        shared.shotgun_bullets = []
+        shared.pistol_bullets = []
+        shared.fireballs = []
+        self.old_dt = getattr(shared, "dt", None)
+
+    def tearDown(self):
+        enemies.store.clear()
+        enemies.registry.clear()
+        shared.sawblades = []
+        shared.dt = self.old_dt
+
+    def damage_over_game_second(self, dt: float) -> float:
+        target = Target((100, 100))
+        enemies.registry.add(target)
+        blade = Sawblade((100, 100), 0.0, 0, 10.0, 7)
+        shared.sawblades = [blade]
+
+        shared.dt = dt
+        damage = DamageSystem()
+        for _ in range(round(1 / dt)):
+            damage.apply_hits()
+
+        enemies.registry.remove(target)
+        return 1000.0 - target.health
+
+    def test_fixed_step_matches_baseline_frame(self):
+        baseline = self.damage_over_game_second(shared.FRAME_DT)
+        fixed = self.damage_over_game_second(shared.TIME_SCALE / shared.SIM_RATE)
+
+        self.assertAlmostEqual(baseline, 70)
+        self.assertAlmostEqual(fixed, baseline)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import types
+import unittest
+
+import pygame
+
+from src import enemies, shared
+from src.active_region import ActiveRegion
+
+
+class Enemy:
+    def __init__(self, pos) -> None:
+        self.rect = pygame.Rect(pos, (16, 16))
+
+
+class RegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = enemies.EnemyRegistry()
+
+    def test_remove_after_moving_leaves_no_stale_entry(self):
+        enemy = Enemy((0, 0))
+        self.registry.add(enemy)
+        enemy.rect.topleft = (500, 500)
+
+        self.registry.remove(enemy)
+
+        self.assertEqual(self.registry.nearby(pygame.Rect(0, 0, 32, 32)), [])
+        self.assertEqual(self.registry.grid.cells, {})
+
+    def test_remove_keeps_other_enemies(self):
+        first, second = Enemy((0, 0)), Enemy((8, 8))
+        self.registry.add(first)
+        self.registry.add(second)
+
+        self.registry.remove(first)
+
+        self.assertEqual(self.registry.in_rect(pygame.Rect(0, 0, 32, 32)), [second])
+
+    def test_contains_only_enemies_not_yet_removed(self):
+        first, second = Enemy((0, 0)), Enemy((8, 8))
+        self.registry.add(first)
+        self.registry.add(second)
+
+        self.registry.remove(first)
+        self.registry.reindex()
+
+        self.assertNotIn(first, self.registry)
+        self.assertIn(second, self.registry)
+
+
+class Chaser:
+    pos = enemies.store.vector("x", "y")
+    speed = enemies.store.column("speed")
+    spawned = enemies.store.flag("flags", enemies.SPAWNED)
+    near = enemies.store.flag("flags", enemies.NEAR)
+
+    def __init__(self, pos) -> None:
+        self.row = enemies.store.add(self)
+        self.pos = pos
+        self.speed = 10
+        self.spawned = True
+        self.rect = pygame.Rect(pos, (16, 16))
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+    def resume(self, slept: float):
+        pass
+
+
+class ActiveRegionTest(unittest.TestCase):
+    def setUp(self):
+        enemies.store.clear()
+        shared.dt = 1.0
+        shared.player = types.SimpleNamespace(
+            collider=types.SimpleNamespace(pos=pygame.Vector2(0, 0))
+        )
+        self.region = ActiveRegion()
+        self.region.rect = pygame.Rect(0, 0, 200, 200)
+
+    def tearDown(self):
+        enemies.store.clear()
+
+    def test_chase_skips_enemies_outside_the_region(self):
+        close, far = Chaser((100, 0)), Chaser((1000, 0))
+        for enemy in (close, far):
+            self.region.tick(enemy)
+
+        enemies.ChaseSystem().update()
+
+        self.assertEqual(close.pos, pygame.Vector2(90, 0))
+        self.assertEqual(far.pos, pygame.Vector2(1000, 0))
+        self.assertEqual((close.updates, far.updates), (1, 0))
+
+    def test_forgets_enemy_that_died_frozen(self):
+        far = Chaser((1000, 0))
+        self.region.tick(far)
+
+        self.region.forget(far)
+
+        self.assertEqual(self.region.frozen_at, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
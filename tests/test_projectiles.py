@@ -0,0 +1,64 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src import enemies, shared, utils
+from src.projectiles import Bullet, Coin
+
+
+class Target:
+    pos = enemies.store.vector("x", "y")
+
+    def __init__(self, pos) -> None:
+        self.row = enemies.store.add(self)
+        self.pos = pos
+        self.rect = pygame.Rect(pos, (16, 16))
+
+
+class RicochetTest(unittest.TestCase):
+    def setUp(self):
+        pygame.display.set_mode((1, 1))
+        shared.dt = 0.05
+        shared.tile_grid = utils.TileGrid(40, 40, shared.TILE_SIDE)
+        enemies.store.clear()
+        enemies.registry.clear()
+
+    def tearDown(self):
+        enemies.store.clear()
+        enemies.registry.clear()
+
+    def redirect(self, target: Target) -> Bullet:
+        bullet = Bullet((100, 100), 0.0, 200, 10.0, 1)
+        Coin((100, 100), 0.0, 0, 1.0).redirect_to_enemy(target, bullet)
+        return bullet
+
+    def test_follows_target_that_moves_after_redirect(self):
+        target = Target((300, 100))
+        enemies.registry.add(target)
+        bullet = self.redirect(target)
+
+        target.pos = (300, 300)
+        for _ in range(40):
+            bullet.update()
+
+        self.assertEqual(bullet.pos, pygame.Vector2(300, 300))
+
+    def test_keeps_last_position_of_dead_target(self):
+        target = Target((300, 100))
+        enemies.registry.add(target)
+        bullet = self.redirect(target)
+
+        bullet.update()
+        enemies.registry.remove(target)
+        enemies.store.release(target.row)
+        for _ in range(40):
+            bullet.update()
+
+        self.assertEqual(bullet.pos, pygame.Vector2(300, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
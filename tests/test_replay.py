@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+
+from src import shared
+from src.replay import InputPlayer, InputRecorder
+
+
+class RecorderTest(unittest.TestCase):
+    def setUp(self):
+        shared.save_data = {"max_level": 2}
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_closes_recording_when_session_raises(self):
+        with self.assertRaises(RuntimeError):
+            with InputRecorder(self.path, 7, 2) as recorder:
+                raise RuntimeError
+
+        self.assertTrue(recorder.file.closed)
+        player = InputPlayer(self.path)
+        self.assertEqual((player.seed, player.level_no), (7, 2))
+        self.assertEqual(player.save_data, {"max_level": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()